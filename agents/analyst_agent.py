@@ -1,26 +1,177 @@
 import sys
 from pathlib import Path
 import json
-from sentence_transformers import SentenceTransformer, util
+import numpy as np
 
 # Add parent directory to sys.path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+# ✅ Imports
+from utils.embedding_cache import EmbeddingCache
+from utils.embedding_backends import BACKENDS, load_backend
+from utils.lazy import LazyModel, warm_up
+
 # ✅ Setup paths
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 INPUT_FILE = PROJECT_ROOT / "data" / "recruiter_enriched.json"
 JD_FILE = PROJECT_ROOT / "data" / "job_descriptions" / "job_description.txt"
 OUTPUT_FILE = PROJECT_ROOT / "data" / "analyst_output.json"
 
-# 🧠 Load the transformer model
-model = SentenceTransformer("all-MiniLM-L6-v2")
+# 🧠 Transformer model, loaded on first use through the selected inference backend
+MODEL_NAME = "all-MiniLM-L6-v2"
+BACKEND = "torch"  # "torch" (float32), "torch-int8", "onnx" or "onnx-int8"; see utils.embedding_backends
+
+def model_label(backend):
+    return MODEL_NAME if backend == "torch" else f"{MODEL_NAME} ({backend})"
+
+# 🗄️ Embeddings differ slightly per backend, so each backend gets its own cache
+def cache_name(backend=None):
+    backend = backend or BACKEND
+    return MODEL_NAME if backend == "torch" else f"{MODEL_NAME}-{backend}"
+
+model = LazyModel(model_label(BACKEND), lambda: load_backend(BACKEND, MODEL_NAME))
+
+# ⚙️ Resumes encoded per forward pass
+BATCH_SIZE = 64
+
+# ✂️ Long resumes are split into overlapping word windows that fit MiniLM's 256-token limit;
+#    a window ends at CHUNK_WORDS words or MAX_CHUNK_TOKENS tokens, whichever comes first
+#    (symbols, numbers and rare words split into several tokens, so 160 words can exceed 256)
+CHUNK_WORDS = 160
+CHUNK_OVERLAP = 32
+MAX_CHUNK_TOKENS = 254  # 256 minus the [CLS] and [SEP] tokens the model adds
+POOLING = "mean"  # "mean": cosine of the averaged chunk embedding, "max": best-matching chunk
+
+# 🔤 The model's tokenizer on its own, so chunking a fully cached run never loads the model
+def load_tokenizer():
+    from transformers import AutoTokenizer
+    return AutoTokenizer.from_pretrained(f"sentence-transformers/{MODEL_NAME}")
+
+tokenizer = LazyModel(f"{MODEL_NAME} tokenizer", load_tokenizer)
+
+# 🗄️ On-disk embedding cache shared by every screening run (opens without loading the model)
+embedding_cache = LazyModel("embedding cache", lambda: EmbeddingCache(cache_name()))
+
+# 🔁 Switch the inference backend by name (model and cache load lazily on next use)
+def use_backend(name):
+    global BACKEND, model, embedding_cache
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown analyst backend {name!r}; choose from {', '.join(BACKENDS)}")
+    BACKEND = name
+    model = LazyModel(model_label(name), lambda: load_backend(name, MODEL_NAME))
+    embedding_cache = LazyModel("embedding cache", lambda: EmbeddingCache(cache_name(name)))
+
+# 📏 Embedding width, from the cache when possible so a fully cached run never loads the model
+def embedding_dim():
+    return embedding_cache.get().dim or model.get().get_sentence_embedding_dimension()
+
+# 🔥 Start loading the model in the background
+def warm_up_model():
+    return warm_up(model, tokenizer, embedding_cache)
+
+# 🔢 Encode texts with the model only (no cache)
+def encode_texts(texts, batch_size=BATCH_SIZE):
+    embeds = model.get().encode(list(texts), batch_size=batch_size, convert_to_numpy=True, normalize_embeddings=True)
+    return embeds.astype(np.float32, copy=False)
+
+# 🔢 Encode texts in mini-batches into unit-length float32 rows, cache first
+#    cache_counts ({"hits", "misses"}, e.g. PipelineMetrics.cache_counter) counts this caller's lookups
+def embed_texts(texts, batch_size=BATCH_SIZE, use_cache=True, cache_counts=None):
+    texts = list(texts)
+    if not texts:
+        return np.zeros((0, embedding_dim()), dtype=np.float32)
+    if not use_cache:
+        return encode_texts(texts, batch_size=batch_size)
 
-# 🧮 Compare resume with JD using cosine similarity
+    cache = embedding_cache.get()
+    cached = cache.get_many(texts)
+    if cache_counts is not None:
+        misses = sum(e is None for e in cached)
+        cache_counts["hits"] += len(texts) - misses
+        cache_counts["misses"] += misses
+    missing = list(dict.fromkeys(t for t, e in zip(texts, cached) if e is None))
+    if missing:
+        fresh = dict(zip(missing, encode_texts(missing, batch_size=batch_size)))
+        cache.put_many(missing, [fresh[t] for t in missing])
+        cached = [fresh[t] if e is None else e for t, e in zip(texts, cached)]
+    cache.flush()  # also when everything hit, so the LRU order of hot rows is saved
+    return np.vstack(cached).astype(np.float32, copy=False)
+
+# 💯 Cosine similarities -> scores out of 100
+def to_score(similarities):
+    return np.round(np.asarray(similarities, dtype=np.float64) * 100, 2)
+
+# 🔢 Tokens each word takes (BERT tokenizers split on whitespace first, so words count independently)
+def word_token_counts(words):
+    return [len(ids) for ids in tokenizer.get()(words, add_special_tokens=False)["input_ids"]]
+
+# ✂️ Split text into overlapping word windows (always at least one chunk)
+def chunk_text(text, chunk_words=CHUNK_WORDS, overlap=CHUNK_OVERLAP, max_tokens=MAX_CHUNK_TOKENS):
+    words = text.split()
+    # Every token covers at least one character, so short texts fit without tokenizing
+    if len(words) <= chunk_words and sum(map(len, words)) <= max_tokens:
+        return [" ".join(words)]
+    counts = word_token_counts(words)
+    chunks, start = [], 0
+    while True:
+        end, tokens = start, 0
+        while end < len(words) and end - start < chunk_words and (end == start or tokens + counts[end] <= max_tokens):
+            tokens += counts[end]
+            end += 1
+        chunks.append(" ".join(words[start:end]))
+        if end >= len(words):
+            return chunks
+        start = max(start + 1, end - overlap)
+
+# 📑 Flatten every resume's chunks into one list plus the start row of each resume
+def chunk_resumes(resume_texts):
+    chunks, offsets = [], []
+    for text in resume_texts:
+        offsets.append(len(chunks))
+        chunks.extend(chunk_text(text))
+    return chunks, np.array(offsets, dtype=np.int64)
+
+# 🧷 One unit vector per resume: mean of its chunk embeddings (all chunks embedded in one batched pass)
+def embed_resumes(resume_texts, batch_size=BATCH_SIZE, cache_counts=None):
+    if not resume_texts:
+        return embed_texts([], batch_size=batch_size)
+    chunks, offsets = chunk_resumes(resume_texts)
+    pooled = np.add.reduceat(embed_texts(chunks, batch_size=batch_size, cache_counts=cache_counts), offsets, axis=0)
+    norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+    return pooled / np.where(norms == 0, 1, norms)
+
+# 📐 Pooled cosine similarity of each resume (M) against each JD embedding (N) -> M×N
+def resume_similarities(resume_texts, jd_embeds, batch_size=BATCH_SIZE, pooling=POOLING, cache_counts=None):
+    if not resume_texts:
+        return np.zeros((0, len(jd_embeds)), dtype=np.float32)
+    if pooling == "mean":
+        return embed_resumes(resume_texts, batch_size=batch_size, cache_counts=cache_counts) @ jd_embeds.T
+    if pooling == "max":
+        chunks, offsets = chunk_resumes(resume_texts)
+        chunk_similarities = embed_texts(chunks, batch_size=batch_size, cache_counts=cache_counts) @ jd_embeds.T
+        return np.maximum.reduceat(chunk_similarities, offsets, axis=0)
+    raise ValueError(f"Unknown pooling: {pooling}")
+
+# 🎯 Encode the job description once so callers can reuse it across batches
+def embed_jd(jd_text, cache_counts=None):
+    return embed_texts([jd_text], cache_counts=cache_counts)[0]
+
+# 🧮 Compare resumes with JD using cosine similarity (JD encoded once)
+def compute_analyst_scores(resume_texts, jd_text, batch_size=BATCH_SIZE, jd_embed=None, cache_counts=None):
+    if jd_embed is None:
+        jd_embed = embed_jd(jd_text, cache_counts=cache_counts)
+    similarities = resume_similarities(resume_texts, jd_embed[np.newaxis, :], batch_size=batch_size,
+                                       cache_counts=cache_counts)
+    return to_score(similarities[:, 0]).tolist()
+
+# 🧮 Score M resumes against N job descriptions with one embedding pass per side
+def compute_analyst_matrix(resume_texts, jd_texts, batch_size=BATCH_SIZE, cache_counts=None):
+    jd_embeds = embed_texts(jd_texts, batch_size=batch_size, cache_counts=cache_counts)
+    return to_score(resume_similarities(resume_texts, jd_embeds, batch_size=batch_size, cache_counts=cache_counts))
+
+# 🧮 Compare a single resume with JD using cosine similarity
 def compute_analyst_score(resume_text, jd_text):
-    resume_embed = model.encode(resume_text, convert_to_tensor=True)
-    jd_embed = model.encode(jd_text, convert_to_tensor=True)
-    similarity = util.cos_sim(resume_embed, jd_embed).item()
-    return round(similarity * 100, 2)  # score out of 100
+    return compute_analyst_scores([resume_text], jd_text)[0]  # score out of 100
 
 # 💬 Feedback based on match
 def analyst_feedback(score):
@@ -33,10 +184,17 @@ def analyst_feedback(score):
     else:
         return "Low skill match. Consider for other roles."
 
+# 📝 Text the analyst compares against the JD
+def resume_text_for(resume):
+    return resume.get("clean_text", "") or resume.get("full_text", "")
+
+# 🏷️ Fields the analyst adds to a resume (JD-dependent)
+ANALYST_FIELDS = ("analyst_score", "match_score", "analyst_feedback")
+
 # 🤖 Main agent function
-def analyst_agent(resume, jd_text):
-    resume_text = resume.get("clean_text", "") or resume.get("full_text", "")
-    score = compute_analyst_score(resume_text, jd_text)
+def analyst_agent(resume, jd_text, score=None):
+    if score is None:
+        score = compute_analyst_score(resume_text_for(resume), jd_text)
     feedback = analyst_feedback(score)
 
     resume["analyst_score"] = score
@@ -45,8 +203,14 @@ def analyst_agent(resume, jd_text):
 
     return resume
 
+# 📦 Score a whole list of resumes with one batched encoding pass
+def batch_analyst_agent(resumes, jd_text, batch_size=BATCH_SIZE, jd_embed=None, cache_counts=None):
+    texts = [resume_text_for(r) for r in resumes]
+    scores = compute_analyst_scores(texts, jd_text, batch_size=batch_size, jd_embed=jd_embed, cache_counts=cache_counts)
+    return [analyst_agent(resume, jd_text, score=score) for resume, score in zip(resumes, scores)]
+
 # 🗂️ Batch processor
-def batch_process_analyst():
+def batch_process_analyst(batch_size=BATCH_SIZE):
     if not INPUT_FILE.exists():
         print(f"❌ Input file not found: {INPUT_FILE}")
         return
@@ -60,7 +224,7 @@ def batch_process_analyst():
     with open(JD_FILE, "r", encoding="utf-8") as f:
         jd_text = f.read()
 
-    scored = [analyst_agent(resume, jd_text) for resume in resumes]
+    scored = batch_analyst_agent(resumes, jd_text, batch_size=batch_size)
 
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
         json.dump(scored, f, indent=2)
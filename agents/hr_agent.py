@@ -1,26 +1,86 @@
 import sys
 from pathlib import Path
 import json
-import re
+import hashlib
+
+import numpy as np
 
 # Add parent directory to sys.path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+# ✅ Imports
+from utils.lazy import LazyModel
+from utils.phrase_matcher import PhraseMatcher
+
 # ✅ Setup paths
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 INPUT_FILE = PROJECT_ROOT / "data" / "analyst_output.json"
 OUTPUT_FILE = PROJECT_ROOT / "data" / "hr_output.json"
+TAXONOMY_FILE = PROJECT_ROOT / "data" / "hr_taxonomy.json"  # optional, replaces the defaults below
 
 # 🔎 Define soft skills and red flag keywords
 SOFT_SKILLS = {"communication", "teamwork", "leadership", "problem solving", "time management", "adaptability", "creativity", "collaboration"}
 RED_FLAGS = {"unemployed", "fresher", "terminated", "job hopping", "gap", "no experience"}
 
-# 🧠 Score and feedback logic
-def score_hr(soft_skills, red_flags):
-    score = 50
-    score += len(soft_skills) * 10
-    score -= len(red_flags) * 10
-    return max(0, min(score, 100))  # bounded between 0–100
+# 📚 Taxonomy: {"soft_skills": {phrase: weight}, "red_flags": {phrase: weight}}
+def default_taxonomy():
+    return {
+        "soft_skills": {skill: 1 for skill in SOFT_SKILLS},
+        "red_flags": {flag: 1 for flag in RED_FLAGS},
+    }
+
+def load_taxonomy(path=TAXONOMY_FILE):
+    if not Path(path).exists():
+        return default_taxonomy()
+    with open(path, "r", encoding="utf-8") as f:
+        taxonomy = json.load(f)
+    for category in ("soft_skills", "red_flags"):
+        phrases = taxonomy.get(category, {})
+        if isinstance(phrases, list):
+            phrases = {phrase: 1 for phrase in phrases}
+        taxonomy[category] = {phrase.lower(): weight for phrase, weight in phrases.items()}
+    return taxonomy
+
+# 🕸️ One automaton for every soft skill and red flag; payload is (category, phrase, weight)
+def build_matcher(taxonomy):
+    matcher = PhraseMatcher()
+    for category in ("soft_skills", "red_flags"):
+        for phrase, weight in taxonomy.get(category, {}).items():
+            matcher.add(phrase, (category, phrase, weight))
+    matcher.fingerprint = hashlib.sha256(json.dumps(taxonomy, sort_keys=True).encode("utf-8")).hexdigest()
+    return matcher.build()
+
+hr_matcher = LazyModel("HR keyword matcher", lambda: build_matcher(load_taxonomy()))
+
+# 🔁 Swap in a user-supplied taxonomy (dict or JSON file path)
+def use_taxonomy(taxonomy):
+    global hr_matcher
+    if not isinstance(taxonomy, dict):
+        taxonomy = load_taxonomy(taxonomy)
+    matcher = build_matcher(taxonomy)
+    hr_matcher = LazyModel("HR keyword matcher", lambda: matcher)
+
+# 🪪 Fingerprint of the taxonomy in use, so results cached under another taxonomy are not reused
+def taxonomy_fingerprint():
+    return hr_matcher.get().fingerprint
+
+# 🔍 Soft skills and red flags found in one pass: ({phrase: weight}, {phrase: weight})
+def match_keywords(text):
+    found = {"soft_skills": {}, "red_flags": {}}
+    for category, phrase, weight in hr_matcher.get().find_unique(text):
+        found[category][phrase] = weight
+    return found["soft_skills"], found["red_flags"]
+
+# 🧠 Score and feedback logic (each phrase counts 10 points times its weight)
+#    hr_scores takes whole columns of summed soft-skill and red-flag weights
+def hr_scores(soft_totals, flag_totals):
+    return np.clip(50 + np.asarray(soft_totals) * 10 - np.asarray(flag_totals) * 10, 0, 100)  # bounded between 0–100
+
+def score_hr(soft_skills, red_flags, weights=None):
+    weights = weights or {}
+    soft_total = sum(weights.get(skill, 1) for skill in soft_skills)
+    flag_total = sum(weights.get(flag, 1) for flag in red_flags)
+    return hr_scores(soft_total, flag_total).item()
 
 def feedback_hr(score, soft_skills, red_flags):
     feedback = []
@@ -38,20 +98,25 @@ def feedback_hr(score, soft_skills, red_flags):
 
 # 🤖 Main agent function
 def hr_agent(resume):
-    text = resume.get("clean_text", "").lower()
-
-    soft_skills = sorted({skill for skill in SOFT_SKILLS if skill in text})
-    red_flags = sorted({flag for flag in RED_FLAGS if flag in text})
-    score = score_hr(soft_skills, red_flags)
-    feedback = feedback_hr(score, soft_skills, red_flags)
+    return batch_hr_agent([resume])[0]
 
-    resume.update({
-        "soft_skills": soft_skills,
-        "red_flags": red_flags,
-        "hr_score": score,
-        "hr_feedback": feedback
-    })
-    return resume
+# 📦 HR fields for a whole batch, added in place: keywords are matched per text, scores come from one column
+def batch_hr_agent(resumes):
+    if not resumes:
+        return resumes
+    # Matched in the "raw" preview like the recruiter's contacts, so HR scores do not grow with CV length
+    found = [match_keywords(resume.get("raw") or resume.get("clean_text", "")) for resume in resumes]
+    scores = hr_scores([sum(soft.values()) for soft, _ in found], [sum(flags.values()) for _, flags in found]).tolist()
+    for resume, (soft_weights, flag_weights), score in zip(resumes, found, scores):
+        soft_skills = sorted(soft_weights)
+        red_flags = sorted(flag_weights)
+        resume.update({
+            "soft_skills": soft_skills,
+            "red_flags": red_flags,
+            "hr_score": score,
+            "hr_feedback": feedback_hr(score, soft_skills, red_flags)
+        })
+    return resumes
 
 # 🗂️ Batch processor
 def batch_process_hr():
@@ -62,7 +127,7 @@ def batch_process_hr():
     with open(INPUT_FILE, "r", encoding="utf-8") as f:
         resumes = json.load(f)
 
-    processed = [hr_agent(resume) for resume in resumes]
+    processed = batch_hr_agent(resumes)
 
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
         json.dump(processed, f, indent=2)
@@ -0,0 +1,477 @@
+import sys
+from pathlib import Path
+from itertools import islice
+
+# Add parent directory to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+# ✅ Imports
+from utils import resume_parser, skills_extractor
+from utils.resume_parser import list_resume_files, parse_files_parallel
+from utils.manifest import MANIFEST_FILE, ScreeningManifest, hash_text
+from utils.vector_index import IVFIndex
+from utils.metrics import PipelineMetrics
+from utils.buffer_store import upload_store
+from utils.candidate_record import CandidateRecord, to_plain
+from utils.result_store import ResultStore
+from agents import recruiter_agent as recruiter
+from agents import analyst_agent as analyst
+from agents import hr_agent as hr
+from agents import recommender_agent as recommender
+
+# 📁 Setup paths
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+RESUME_FOLDER = PROJECT_ROOT / "data" / "resumes"
+JD_FILE = PROJECT_ROOT / "data" / "job_descriptions" / "job_description.txt"
+STREAM_OUTPUT = PROJECT_ROOT / "data" / "final_recommendations.jsonl"
+
+# ⚙️ Streaming settings
+STREAM_BATCH_SIZE = 256  # records held in memory at once per stage
+TOP_K = 5
+SHORTLIST_FACTOR = 10  # ANN candidates fetched per final top-K slot before the full blend
+INDEX_MIN_RESUMES = 5_000  # pools this large are ranked from an index shortlist instead of a full scan
+
+# 🗂️ Stage order and the debug file each stage writes when asked to
+STAGES = ["parse", "recruiter", "analyst", "hr", "recommender"]
+STAGE_FILES = {
+    "parse": resume_parser.OUTPUT_FILE,
+    "recruiter": recruiter.OUTPUT_FILE,
+    "analyst": analyst.OUTPUT_FILE,
+    "hr": hr.OUTPUT_FILE,
+    "recommender": recommender.OUTPUT_FILE,
+}
+
+# 💾 Dump a stage snapshot (only used for debugging) as an indexed JSON Lines store; debug_dir keeps runs apart
+def write_stage(stage, records, debug_dir=None):
+    output_file = STAGE_FILES[stage].with_suffix(".jsonl")
+    if debug_dir is not None:
+        output_file = Path(debug_dir) / output_file.name
+    ResultStore(output_file).write(records)
+
+# 📥 Resolve JD text and resume files from arguments or default paths
+def resolve_inputs(jd_text, resume_folder, files, jd_file):
+    if jd_text is None:
+        if not Path(jd_file).exists():
+            print(f"❌ Job description not found: {jd_file}")
+            return None, None
+        with open(jd_file, "r", encoding="utf-8") as f:
+            jd_text = f.read()
+
+    files = resolve_files(resume_folder, files)
+    if files is None:
+        return None, None
+    return jd_text, files
+
+# 📂 Resume files from an explicit list or a folder
+def resolve_files(resume_folder, files):
+    if files is None:
+        if not Path(resume_folder).exists():
+            print(f"❌ Folder not found: {resume_folder}")
+            return None
+        files = list_resume_files(resume_folder)
+    return files
+
+# ⏱️ Metrics for one run, watching every lazily loaded model and the embedding cache
+def start_metrics(metrics=None):
+    metrics = metrics or PipelineMetrics()
+    metrics.watch_models(resume_parser.nlp, skills_extractor.skills_matcher, hr.hr_matcher,
+                         analyst.model, analyst.tokenizer, analyst.embedding_cache)
+    return metrics
+
+# 🧾 Stop the clock and optionally append the summary to a JSON Lines log
+def finish_metrics(metrics, metrics_log=None, **context):
+    metrics.finish()
+    if metrics_log:
+        metrics.write_log(metrics_log, **context)
+    return metrics
+
+# 🧩 (file, CandidateRecord) pairs, reporting per-file errors (and per-file extraction time to metrics)
+def iter_parsed_files(files, workers=resume_parser.MAX_WORKERS, metrics=None):
+    on_document = None
+    if metrics is not None:
+        def on_document(file, seconds, error):
+            metrics.record_document(file.name, "extract", seconds, error)
+
+    for file, resume, error in parse_files_parallel(files, workers=workers, on_document=on_document):
+        if error:
+            print(f"⚠️ Error processing {file.name}: {error}")
+        else:
+            yield file, CandidateRecord.from_dict(resume)
+
+# 🧩 Parsed resumes as CandidateRecords
+def iter_parsed(files, workers=resume_parser.MAX_WORKERS, metrics=None):
+    for _, record in iter_parsed_files(files, workers=workers, metrics=metrics):
+        yield record
+
+# 📦 Group an iterable into lists of at most `size` items
+def iter_batches(items, size):
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+# 🚀 Run every agent over in-memory records and return the final list
+def run_pipeline(jd_text=None, resume_folder=RESUME_FOLDER, files=None, jd_file=JD_FILE,
+                 workers=resume_parser.MAX_WORKERS, batch_size=analyst.BATCH_SIZE,
+                 save_intermediate=False, debug_dir=None, on_stage=None, metrics=None, metrics_log=None):
+    jd_text, files = resolve_inputs(jd_text, resume_folder, files, jd_file)
+    if jd_text is None:
+        return []
+    metrics = start_metrics(metrics)
+
+    def stage(name, run):
+        if on_stage:
+            on_stage(name)
+        with metrics.stage(name) as entry:
+            records = run()
+            entry["items"] += len(records)
+        if save_intermediate:
+            write_stage(name, records, debug_dir=debug_dir)
+        return records
+
+    records = stage("parse", lambda: list(iter_parsed(files, workers=workers, metrics=metrics)))
+    records = stage("recruiter", lambda: recruiter.batch_recruiter_agent(records))
+    records = stage("analyst", lambda: analyst.batch_analyst_agent(
+        records, jd_text, batch_size=batch_size, cache_counts=metrics.cache_counter("embeddings")))
+    records = stage("hr", lambda: hr.batch_hr_agent(records))
+    records = stage("recommender", lambda: recommender.batch_recommender_agent(records))
+
+    finish_metrics(metrics, metrics_log, pipeline="full", resumes=len(files))
+    print(f"✅ Pipeline screened {len(records)} resumes")
+    return records
+
+# 🌊 Generator pipeline: records flow through every agent one micro-batch at a time
+def stream_pipeline(jd_text, files, workers=resume_parser.MAX_WORKERS, batch_size=analyst.BATCH_SIZE,
+                    micro_batch=STREAM_BATCH_SIZE, on_progress=None, metrics=None):
+    metrics = metrics or PipelineMetrics()
+    embedding_counts = metrics.cache_counter("embeddings")
+    with metrics.stage("analyst"):
+        jd_embed = analyst.embed_jd(jd_text, cache_counts=embedding_counts)
+    parsed = metrics.iter_stage("parse", iter_parsed(files, workers=workers, metrics=metrics))
+    done = 0
+    for batch in iter_batches(parsed, micro_batch):
+        with metrics.stage("recruiter", items=len(batch)):
+            batch = recruiter.batch_recruiter_agent(batch)
+        with metrics.stage("analyst", items=len(batch)):
+            batch = analyst.batch_analyst_agent(batch, jd_text, batch_size=batch_size, jd_embed=jd_embed,
+                                                cache_counts=embedding_counts)
+        with metrics.stage("hr", items=len(batch)):
+            batch = hr.batch_hr_agent(batch)
+        with metrics.stage("recommender", items=len(batch)):
+            batch = recommender.batch_recommender_agent(batch)
+        done += len(batch)
+        if on_progress:
+            on_progress("recommender", done, len(files))
+        yield from batch
+
+# 🗃️ Stream every result to an indexed JSON Lines store (utils.result_store) and keep only the top K in memory
+#    ranked=True writes the store in rank order instead, via sorted spill chunks merged at the end
+#    append=True adds this run's results after those already in the store (e.g. a new batch of resumes)
+def run_streaming_pipeline(jd_text=None, resume_folder=RESUME_FOLDER, files=None, jd_file=JD_FILE,
+                           output_file=STREAM_OUTPUT, top_k=TOP_K, workers=resume_parser.MAX_WORKERS,
+                           batch_size=analyst.BATCH_SIZE, micro_batch=STREAM_BATCH_SIZE, ranked=False,
+                           append=False, on_progress=None, metrics=None, metrics_log=None):
+    if ranked and append:
+        raise ValueError("ranked output is rewritten in full and cannot be appended to")
+    jd_text, files = resolve_inputs(jd_text, resume_folder, files, jd_file)
+    if jd_text is None:
+        return []
+    metrics = start_metrics(metrics)
+
+    results = stream_pipeline(jd_text, files, workers=workers, batch_size=batch_size,
+                              micro_batch=micro_batch, on_progress=on_progress, metrics=metrics)
+    with recommender.TopKRanker(top_k, spill_dir=True if ranked else None) as ranker:
+        if ranked:
+            ranker.extend(results)
+            count = ranker.write_ranked(output_file)
+        else:
+            with ResultStore(output_file).writer(append=append) as writer:
+                for resume in results:
+                    writer.add(resume)
+                    ranker.push(resume)
+            count = ranker.count
+        top = ranker.top()
+
+    finish_metrics(metrics, metrics_log, pipeline="streaming", resumes=len(files))
+    print(f"✅ Streamed {count} resumes to {output_file}")
+    return top
+
+# 🔑 What base records depend on besides the file itself: the skills and HR keyword taxonomies,
+#    and BASE_RECORDS_VERSION, bumped when the recruiter or HR agents change what they read
+BASE_RECORDS_VERSION = 2
+
+def base_records_key():
+    return hash_text(f"{BASE_RECORDS_VERSION}\0{skills_extractor.skills_fingerprint()}\0{hr.taxonomy_fingerprint()}")
+
+# 🧱 Parse + recruiter + HR for content the manifest has not seen; returns screenable files
+def screen_base_records(files, manifest, hashes, workers=resume_parser.MAX_WORKERS, on_progress=None, metrics=None):
+    metrics = metrics or PipelineMetrics()
+    manifest.use_records_key(base_records_key())
+    changed = [file for file in files if hashes[file] not in manifest.records]
+    changed = list({hashes[file]: file for file in changed}.values())
+    metrics.record_cache("manifest", hits=len(set(hashes.values())) - len(changed), misses=len(changed))
+    if on_progress:
+        on_progress("parse", 0, len(changed))
+    if changed:
+        parsed = metrics.iter_stage("parse", iter_parsed_files(changed, workers=workers, metrics=metrics))
+        done = 0
+        for pairs in iter_batches(parsed, STREAM_BATCH_SIZE):
+            batch = [record for _, record in pairs]
+            with metrics.stage("recruiter", items=len(batch)):
+                batch = recruiter.batch_recruiter_agent(batch)
+            with metrics.stage("hr", items=len(batch)):
+                batch = hr.batch_hr_agent(batch)
+            for (file, _), base in zip(pairs, batch):
+                base.pop("file_name")
+                manifest.records[hashes[file]] = base
+            done += len(batch)
+            if on_progress:
+                on_progress("parse", done, len(changed))
+    screened = [file for file in files if hashes[file] in manifest.records]
+    return screened, len(changed)
+
+# 🔑 Manifest key for analyst scores: the JD plus the inference backend that scored it
+#    (float32 torch keeps the plain JD hash, so existing manifests stay valid)
+def analyst_key(jd_text):
+    if analyst.BACKEND == "torch":
+        return hash_text(jd_text)
+    return hash_text(f"{analyst.BACKEND}\0{jd_text}")
+
+# 🎯 Final records under one JD for (content hash, file name) pairs, blended as one batch
+def final_records(manifest, entries, jd_hash):
+    records = []
+    for content_hash, file_name in entries:
+        resume = manifest.records[content_hash].copy()
+        resume.update(manifest.get_analyst(content_hash, jd_hash))
+        resume["file_name"] = file_name
+        records.append(resume)
+    return recommender.batch_recommender_agent(records)
+
+# ♻️ Incremental run: only new/changed files are parsed, only the JD stages rerun on a JD edit
+#    Pools of INDEX_MIN_RESUMES or more (or use_index=True) are ranked through the ANN index kept next to
+#    the manifest: only a shortlist of top_k * SHORTLIST_FACTOR resumes is scored, and only it is returned.
+def run_incremental_pipeline(jd_text=None, resume_folder=RESUME_FOLDER, files=None, jd_file=JD_FILE,
+                             manifest_file=MANIFEST_FILE, workers=resume_parser.MAX_WORKERS,
+                             batch_size=analyst.BATCH_SIZE, on_stage=None, on_progress=None, top_k=TOP_K,
+                             use_index=None, index_dir=None, metrics=None, metrics_log=None):
+    jd_text, files = resolve_inputs(jd_text, resume_folder, files, jd_file)
+    if jd_text is None:
+        return []
+    metrics = start_metrics(metrics)
+
+    with metrics.stage("manifest", items=len(files)):
+        manifest = ScreeningManifest(manifest_file)
+        hashes = {file: manifest.content_hash(file) for file in files}
+
+    # Stage 1: parse + recruiter + HR, only for content not seen before
+    if on_stage:
+        on_stage("parse")
+    screened, parsed_count = screen_base_records(files, manifest, hashes, workers=workers, on_progress=on_progress,
+                                                 metrics=metrics)
+    manifest.prune(files, hashes.values())
+    embedding_counts = metrics.cache_counter("embeddings")
+    if use_index is None:
+        use_index = len({hashes[f] for f in screened}) >= INDEX_MIN_RESUMES
+
+    if use_index:
+        # Stage 2+3: shortlist from the index, exact scores and blend for the shortlist only
+        if on_stage:
+            on_stage("analyst")
+        index_dir = index_dir or index_dir_for(manifest_file)
+        with metrics.stage("index"):
+            sync_candidate_index(manifest, index_dir=index_dir, batch_size=batch_size, cache_counts=embedding_counts)
+        names = {}
+        for file in screened:
+            names.setdefault(hashes[file], file.name)
+        with metrics.stage("analyst") as entry:
+            records, scored = shortlist_records(manifest, jd_text, names, top_k=top_k, index_dir=index_dir,
+                                                batch_size=batch_size, cache_counts=embedding_counts)
+            entry["items"] += scored
+        metrics.record_cache("analyst_scores", hits=len(records) - scored, misses=scored)
+        if on_progress:
+            on_progress("recommender", len(records), len(records))
+    else:
+        # Stage 2: analyst scores for this JD, only where missing
+        if on_stage:
+            on_stage("analyst")
+        jd_hash = analyst_key(jd_text)
+        missing = list(dict.fromkeys(hashes[f] for f in screened if manifest.get_analyst(hashes[f], jd_hash) is None))
+        scored = len(missing)
+        metrics.record_cache("analyst_scores", hits=len({hashes[f] for f in screened}) - len(missing),
+                             misses=len(missing))
+        if on_progress:
+            on_progress("analyst", 0, len(missing))
+        if missing:
+            with metrics.stage("analyst"):
+                jd_embed = analyst.embed_jd(jd_text, cache_counts=embedding_counts)
+            done = 0
+            for batch in iter_batches(missing, STREAM_BATCH_SIZE):
+                with metrics.stage("analyst", items=len(batch)):
+                    texts = [analyst.resume_text_for(manifest.records[h]) for h in batch]
+                    scores = analyst.compute_analyst_scores(texts, jd_text, batch_size=batch_size, jd_embed=jd_embed,
+                                                            cache_counts=embedding_counts)
+                for content_hash, score in zip(batch, scores):
+                    fields = analyst.analyst_agent({}, jd_text, score=score)
+                    manifest.put_analyst(content_hash, jd_hash, {k: fields[k] for k in analyst.ANALYST_FIELDS})
+                done += len(batch)
+                if on_progress:
+                    on_progress("analyst", done, len(missing))
+
+        # Stage 3: final blend is cheap, always recomputed
+        if on_stage:
+            on_stage("recommender")
+        with metrics.stage("recommender", items=len(screened)):
+            records = final_records(manifest, [(hashes[file], file.name) for file in screened], jd_hash)
+        if on_progress:
+            on_progress("recommender", len(records), len(records))
+
+    with metrics.stage("manifest"):
+        manifest.save()
+    finish_metrics(metrics, metrics_log, pipeline="incremental", resumes=len(files), indexed=use_index)
+    print(f"✅ Pipeline screened {len(records)} resumes ({parsed_count} parsed, {scored} scored)")
+    return records
+
+# 🧮 Rank one resume pool against many JDs: {jd name: top-K records}
+def run_multi_jd_pipeline(jd_texts, resume_folder=RESUME_FOLDER, files=None, top_k=TOP_K,
+                          manifest_file=MANIFEST_FILE, workers=resume_parser.MAX_WORKERS,
+                          batch_size=analyst.BATCH_SIZE, on_stage=None, on_progress=None,
+                          metrics=None, metrics_log=None):
+    files = resolve_files(resume_folder, files)
+    if files is None or not jd_texts:
+        return {}
+    metrics = start_metrics(metrics)
+
+    with metrics.stage("manifest", items=len(files)):
+        manifest = ScreeningManifest(manifest_file)
+        hashes = {file: manifest.content_hash(file) for file in files}
+
+    if on_stage:
+        on_stage("parse")
+    screened, parsed_count = screen_base_records(files, manifest, hashes, workers=workers, on_progress=on_progress,
+                                                 metrics=metrics)
+
+    # One embedding pass for all resumes and one for all JDs -> M×N matrix
+    if on_stage:
+        on_stage("analyst")
+    jd_names = list(jd_texts)
+    jd_hashes = [analyst_key(jd_texts[name]) for name in jd_names]
+    unique_hashes = list(dict.fromkeys(hashes[f] for f in screened))
+    if on_progress:
+        on_progress("analyst", 0, len(unique_hashes))
+    resume_texts = [analyst.resume_text_for(manifest.records[h]) for h in unique_hashes]
+    with metrics.stage("analyst", items=len(unique_hashes)):
+        matrix = analyst.compute_analyst_matrix(resume_texts, [jd_texts[name] for name in jd_names],
+                                                batch_size=batch_size, cache_counts=metrics.cache_counter("embeddings"))
+    for row, content_hash in enumerate(unique_hashes):
+        for col, jd_hash in enumerate(jd_hashes):
+            score = float(matrix[row, col])
+            fields = analyst.analyst_agent({}, None, score=score)
+            manifest.put_analyst(content_hash, jd_hash, {k: fields[k] for k in analyst.ANALYST_FIELDS})
+    if on_progress:
+        on_progress("analyst", len(unique_hashes), len(unique_hashes))
+
+    if on_stage:
+        on_stage("recommender")
+    rankings = {}
+    for done, (name, jd_hash) in enumerate(zip(jd_names, jd_hashes), start=1):
+        with metrics.stage("recommender", items=len(screened)):
+            records = final_records(manifest, [(hashes[file], file.name) for file in screened], jd_hash)
+            rankings[name] = recommender.top_k_resumes(records, top_k)
+        if on_progress:
+            on_progress("recommender", done, len(jd_names))
+
+    with metrics.stage("manifest"):
+        manifest.prune(files, hashes.values())
+        manifest.save()
+    finish_metrics(metrics, metrics_log, pipeline="multi_jd", resumes=len(files), job_descriptions=len(jd_names))
+    print(f"✅ Ranked {len(screened)} resumes against {len(jd_names)} job descriptions ({parsed_count} parsed)")
+    return rankings
+
+# 📬 Job-queue handler: params are JSON (folders/paths as strings), result is JSON-ready
+#    {"candidates": top-K list (or {jd name: top-K} with jd_texts), "metrics": per-stage timings}
+#    With "upload_key" the resumes are read from the in-memory upload store instead of resume_folder.
+def run_screening_job(params, report=None):
+    files = None
+    if params.get("upload_key"):
+        files = upload_store.get(params["upload_key"])
+        if files is None:
+            raise RuntimeError("Uploaded resumes are no longer in memory; please upload them again.")
+
+    metrics = PipelineMetrics()
+    common = {
+        "resume_folder": Path(params.get("resume_folder", RESUME_FOLDER)),
+        "files": files,
+        "manifest_file": Path(params.get("manifest_file", MANIFEST_FILE)),
+        "on_progress": report,
+        "metrics": metrics,
+        "metrics_log": params.get("metrics_log"),
+    }
+    top_k = params.get("top_k", TOP_K)
+    if params.get("results_file"):
+        # Large batches: every result goes to a JSON Lines store on disk, only the top K stay in memory
+        top = run_streaming_pipeline(jd_text=params["jd_text"], files=common["files"],
+                                     resume_folder=common["resume_folder"], output_file=Path(params["results_file"]),
+                                     top_k=top_k, on_progress=report, metrics=metrics,
+                                     metrics_log=common["metrics_log"])
+        candidates = [to_plain(r) for r in top]
+    elif "jd_texts" in params:
+        rankings = run_multi_jd_pipeline(params["jd_texts"], top_k=top_k, **common)
+        candidates = {name: [to_plain(r) for r in records] for name, records in rankings.items()}
+    else:
+        records = run_incremental_pipeline(jd_text=params["jd_text"], top_k=top_k,
+                                           use_index=params.get("use_index"), **common)
+        candidates = [to_plain(r) for r in recommender.top_k_resumes(records, top_k)]
+    return {"candidates": candidates, "metrics": metrics.as_dict()}
+
+# 🗂️ The ANN index of a manifest's records lives next to it, so pools never prune each other's index
+def index_dir_for(manifest_file):
+    manifest_file = Path(manifest_file)
+    return manifest_file.with_name(f"{manifest_file.stem}_index")
+
+# 🗂️ Embeddings differ per analyst backend, so index_dir holds one index per backend (named like its cache)
+def backend_index_dir(index_dir):
+    return Path(index_dir) / analyst.cache_name()
+
+# 🧭 Bring the ANN index in line with the manifest: insert new resumes, delete removed ones
+def sync_candidate_index(manifest, index_dir, batch_size=analyst.BATCH_SIZE, cache_counts=None):
+    index = IVFIndex(analyst.embedding_dim(), index_dir=backend_index_dir(index_dir))
+    stale = [content_hash for content_hash in index.ids() if content_hash not in manifest.records]
+    index.remove(stale)
+    new = [content_hash for content_hash in manifest.records if content_hash not in index]
+    for batch in iter_batches(new, STREAM_BATCH_SIZE):
+        texts = [analyst.resume_text_for(manifest.records[h]) for h in batch]
+        index.add(batch, analyst.embed_resumes(texts, batch_size=batch_size, cache_counts=cache_counts))
+    index.save()
+    return index
+
+# 🔎 Final records for the index's shortlist of a JD, restricted to names ({content hash: file name})
+#    The index only shortlists; shortlisted resumes get the exact chunk-pooled score, stored in the manifest.
+#    Returns (records, number of resumes scored now)
+def shortlist_records(manifest, jd_text, names, top_k=TOP_K, shortlist=None, index_dir=None,
+                      batch_size=analyst.BATCH_SIZE, cache_counts=None):
+    index = IVFIndex(analyst.embedding_dim(), index_dir=backend_index_dir(index_dir))
+    jd_hash = analyst_key(jd_text)
+    jd_embed = analyst.embed_jd(jd_text, cache_counts=cache_counts)
+    hits = index.search(jd_embed, shortlist or top_k * SHORTLIST_FACTOR)
+    shortlisted = [h for h, _ in hits if h in manifest.records and h in names]
+
+    unscored = [h for h in shortlisted if manifest.get_analyst(h, jd_hash) is None]
+    if unscored:
+        texts = [analyst.resume_text_for(manifest.records[h]) for h in unscored]
+        scores = analyst.compute_analyst_scores(texts, jd_text, batch_size=batch_size, jd_embed=jd_embed,
+                                                cache_counts=cache_counts)
+        for content_hash, score in zip(unscored, scores):
+            fields = analyst.analyst_agent({}, jd_text, score=score)
+            manifest.put_analyst(content_hash, jd_hash, {k: fields[k] for k in analyst.ANALYST_FIELDS})
+    return final_records(manifest, [(h, names[h]) for h in shortlisted], jd_hash), len(unscored)
+
+# 🔎 Top-K for a JD from a manifest's ANN index (see run_incremental_pipeline), without scoring the whole pool
+def search_top_candidates(jd_text, top_k=TOP_K, shortlist=None, manifest_file=MANIFEST_FILE, index_dir=None):
+    manifest = ScreeningManifest(manifest_file)
+    names = {}
+    for key, entry in manifest.files.items():
+        names.setdefault(entry["sha256"], Path(key).name)
+    records, scored = shortlist_records(manifest, jd_text, names, top_k=top_k, shortlist=shortlist,
+                                        index_dir=index_dir or index_dir_for(manifest_file))
+    if scored:
+        manifest.save()
+    return recommender.top_k_resumes(records, top_k)
@@ -1,30 +1,59 @@
 import sys
 from pathlib import Path
 import json
+import heapq
+import shutil
+import tempfile
+
+import numpy as np
 
 # Add parent directory to sys.path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+# ✅ Imports
+from utils.result_store import ResultStore, encode_record
+
 # ✅ Setup paths
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 INPUT_FILE = PROJECT_ROOT / "data" / "hr_output.json"
 OUTPUT_FILE = PROJECT_ROOT / "data" / "final_recommendations.json"
 
+# ⚙️ Records sorted and written per spill chunk when the full ranking is kept on disk
+SPILL_CHUNK_SIZE = 10_000
+
+# ⚖️ Blend weights (can be tuned as needed)
+RECRUITER_WEIGHT, ANALYST_WEIGHT, HR_WEIGHT = 0.2, 0.5, 0.3
+
+# 🧮 Final weighted scores for whole columns at once
+#    Rounded with round() like compute_final_score: np.round scales by 100 first and turns e.g. 36.945 into 36.94
+def compute_final_scores(rec_scores, ana_scores, hr_scores):
+    blended = (RECRUITER_WEIGHT * np.asarray(rec_scores, dtype=np.float64)
+               + ANALYST_WEIGHT * np.asarray(ana_scores, dtype=np.float64)
+               + HR_WEIGHT * np.asarray(hr_scores, dtype=np.float64))
+    return np.array([round(score, 2) for score in blended.tolist()], dtype=np.float64)
+
 # 🧮 Compute final weighted score
 def compute_final_score(rec_score, ana_score, hr_score):
-    # Weights can be tuned as needed
-    return round(0.2 * rec_score + 0.5 * ana_score + 0.3 * hr_score, 2)
+    return round(RECRUITER_WEIGHT * rec_score + ANALYST_WEIGHT * ana_score + HR_WEIGHT * hr_score, 2)
+
+# 💬 Recommendation tiers: (minimum score, text), checked top-down
+RECOMMENDATION_TIERS = [(80, "Highly recommended for interview."),
+                        (60, "Recommended, meets most expectations."),
+                        (40, "May be considered with reservations.")]
+NOT_RECOMMENDED = "Not recommended for this role."
 
 # 💬 Generate final recommendation
 def generate_recommendation(score):
-    if score >= 80:
-        return "Highly recommended for interview."
-    elif score >= 60:
-        return "Recommended, meets most expectations."
-    elif score >= 40:
-        return "May be considered with reservations."
-    else:
-        return "Not recommended for this role."
+    for threshold, text in RECOMMENDATION_TIERS:
+        if score >= threshold:
+            return text
+    return NOT_RECOMMENDED
+
+# 💬 Recommendation per score, selected over the whole column
+def generate_recommendations(scores):
+    scores = np.asarray(scores)
+    conditions = [scores >= threshold for threshold, _ in RECOMMENDATION_TIERS]
+    return np.select(conditions, [text for _, text in RECOMMENDATION_TIERS], NOT_RECOMMENDED).tolist()
 
 # 🤖 Main agent
 def recommender_agent(resume):
@@ -40,8 +69,122 @@ def recommender_agent(resume):
 
     return resume
 
-# 🗂️ Batch processor
-def batch_process_recommender():
+# 📦 Same result as recommender_agent for a whole batch: the blend runs over score columns
+def batch_recommender_agent(resumes):
+    if not resumes:
+        return []
+    columns = [np.fromiter((r.get(field, 0) for r in resumes), dtype=np.float64, count=len(resumes))
+               for field in ("recruiter_score", "analyst_score", "hr_score")]
+    scores = compute_final_scores(*columns)
+    for resume, score, feedback in zip(resumes, scores.tolist(), generate_recommendations(scores)):
+        resume["recommendation_score"] = score
+        resume["recommendation_feedback"] = feedback
+    return resumes
+
+# 🏆 Rank order: higher score first, then file name, so ties always come out the same way
+def rank_key(resume):
+    return -resume["recommendation_score"], resume.get("file_name") or ""
+
+# 🔃 Inverts comparisons so a min-heap can evict the *later* file name among equal scores
+class _Descending:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return self.value > other.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+# 🥇 Bounded-heap top-K over a stream of scored resumes: O(K) memory, O(log K) per resume.
+#    With spill_dir, every record is also written to sorted chunk files so the full ranking
+#    can be streamed back by merging them (iter_ranked) without holding the pool in memory.
+class TopKRanker:
+    def __init__(self, k, spill_dir=None, chunk_size=SPILL_CHUNK_SIZE):
+        self.k = k
+        self.count = 0
+        self._heap = []  # (score, descending file name, -arrival, record); the worst kept record on top
+        self._chunk_size = chunk_size
+        self._spill_dir = None
+        self._owns_spill_dir = False
+        self._buffer = []
+        self._chunks = []
+        if spill_dir is True:
+            self._spill_dir = Path(tempfile.mkdtemp(prefix="ranking_"))
+            self._owns_spill_dir = True
+        elif spill_dir is not None:
+            self._spill_dir = Path(spill_dir)
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+
+    def push(self, resume):
+        entry = (resume["recommendation_score"], _Descending(resume.get("file_name") or ""), -self.count, resume)
+        self.count += 1
+        if self.k:
+            if len(self._heap) < self.k:
+                heapq.heappush(self._heap, entry)
+            elif entry[:3] > self._heap[0][:3]:
+                heapq.heapreplace(self._heap, entry)
+        if self._spill_dir is not None:
+            self._buffer.append(resume)
+            if len(self._buffer) >= self._chunk_size:
+                self._spill()
+
+    def extend(self, resumes):
+        for resume in resumes:
+            self.push(resume)
+        return self
+
+    # 📋 The K best, best first
+    def top(self):
+        return [entry[3] for entry in sorted(self._heap, key=lambda entry: entry[:3], reverse=True)]
+
+    def _spill(self):
+        chunk_file = self._spill_dir / f"ranked_chunk_{len(self._chunks):05d}.jsonl"
+        with open(chunk_file, "wb") as f:
+            for resume in sorted(self._buffer, key=rank_key):
+                f.write(encode_record(resume))
+        self._chunks.append(chunk_file)
+        self._buffer = []
+
+    # 🌊 Every pushed resume in rank order, k-way merged from the spilled chunks
+    def iter_ranked(self):
+        if self._spill_dir is None:
+            raise ValueError("iter_ranked needs a spill_dir")
+        if self._buffer:
+            self._spill()
+        files = [open(chunk_file, "r", encoding="utf-8") for chunk_file in self._chunks]
+        try:
+            streams = [map(json.loads, f) for f in files]
+            yield from heapq.merge(*streams, key=rank_key)
+        finally:
+            for f in files:
+                f.close()
+
+    # 💾 Full ranking as an indexed JSON Lines store (row = rank - 1)
+    def write_ranked(self, output_file):
+        return ResultStore(output_file).write(self.iter_ranked())
+
+    def close(self):
+        for chunk_file in self._chunks:
+            chunk_file.unlink(missing_ok=True)
+        self._chunks = []
+        if self._owns_spill_dir:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# 🥇 The k best resumes from any iterable, best first, with deterministic ties
+def top_k_resumes(resumes, k):
+    return TopKRanker(k).extend(resumes).top()
+
+# 🗂️ Batch processor; with top_k only the K best are written, in rank order
+def batch_process_recommender(top_k=None):
     if not INPUT_FILE.exists():
         print(f"❌ Input file not found: {INPUT_FILE}")
         return
@@ -49,7 +192,9 @@ def batch_process_recommender():
     with open(INPUT_FILE, "r", encoding="utf-8") as f:
         resumes = json.load(f)
 
-    final_output = [recommender_agent(resume) for resume in resumes]
+    final_output = batch_recommender_agent(resumes)
+    if top_k:
+        final_output = top_k_resumes(final_output, top_k)
 
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
         json.dump(final_output, f, indent=2)
@@ -3,39 +3,44 @@ from pathlib import Path
 import re
 import json
 
+import numpy as np
+
 # Add parent directory to sys.path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 # ✅ Imports
 from utils.resume_parser import extract_text, parse_resume
+from utils.candidate_record import CandidateRecord
 
 # 📁 Setup paths
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 INPUT_FILE = PROJECT_ROOT / "data" / "recruiter_output.json"
 OUTPUT_FILE = PROJECT_ROOT / "data" / "recruiter_enriched.json"
 
+# 🔎 Contact patterns, compiled once
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+PHONE_PATTERN = re.compile(r"\+?\d[\d\s\-]{8,}\d")
+
 # 📧 Extract email
 def extract_email(text):
-    match = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", text)
+    match = EMAIL_PATTERN.search(text)
     return match.group(0) if match else None
 
 # 📞 Extract phone number
 def extract_phone(text):
-    match = re.search(r"\+?\d[\d\s\-]{8,}\d", text)
+    match = PHONE_PATTERN.search(text)
     return match.group(0) if match else None
 
 # 🧼 Clean resume text
 def clean_resume(text):
     return ' '.join(text.split())
 
-# 🧮 Score based on contact info
+# 🧮 Score based on contact info, for whole columns of has-email / has-phone flags
+def compute_recruiter_scores(has_email, has_phone):
+    return 50 * np.asarray(has_email, dtype=np.int64) + 50 * np.asarray(has_phone, dtype=np.int64)  # Out of 100
+
 def compute_recruiter_score(email, phone):
-    score = 0
-    if email:
-        score += 50
-    if phone:
-        score += 50
-    return score  # Out of 100
+    return int(compute_recruiter_scores(bool(email), bool(phone)))
 
 # 💬 Feedback generator
 def recruiter_feedback(score, email, phone):
@@ -52,22 +57,44 @@ def recruiter_feedback(score, email, phone):
         feedback.append("No contact details found.")
     return " ".join(feedback)
 
+# 💬 Feedback only depends on which contacts were found, so batches look it up by 2 * has_email + has_phone
+CONTACT_FEEDBACK = np.array([recruiter_feedback(compute_recruiter_score(email, phone), email, phone)
+                             for email in (False, True) for phone in (False, True)], dtype=object)
+
 # 🤖 Main agent function
 def recruiter_agent(parsed_resume):
-    full_text = parsed_resume.get("raw", "") or parsed_resume.get("full_text", "")
-    email = extract_email(full_text)
-    phone = extract_phone(full_text)
-    recruiter_score = compute_recruiter_score(email, phone)
-    feedback = recruiter_feedback(recruiter_score, email, phone)
-
-    enriched = parsed_resume.copy()
-    enriched.update({
-        "email": email,
-        "phone": phone,
-        "clean_text": clean_resume(full_text),
-        "recruiter_score": recruiter_score,
-        "recruiter_feedback": feedback
-    })
+    return batch_recruiter_agent([parsed_resume])[0]
+
+# 📦 Recruiter fields for a whole batch: contacts are searched per text, scores and feedback come from columns
+def batch_recruiter_agent(parsed_resumes):
+    # Contacts are looked for in the "raw" preview, as before chunked embeddings; only the analyst reads the whole text
+    previews = [resume.get("raw", "") or resume.get("full_text", "") for resume in parsed_resumes]
+    emails = [extract_email(text) for text in previews]
+    phones = [extract_phone(text) for text in previews]
+    has_email = np.array([email is not None for email in emails], dtype=bool)
+    has_phone = np.array([phone is not None for phone in phones], dtype=bool)
+    scores = compute_recruiter_scores(has_email, has_phone).tolist()
+    feedback = CONTACT_FEEDBACK[2 * has_email.astype(np.int64) + has_phone].tolist()
+
+    enriched = []
+    for resume, email, phone, recruiter_score, recruiter_feedback_text in zip(
+            parsed_resumes, emails, phones, scores, feedback):
+        # Records are owned by the pipeline and enriched in place, and derive clean_text from their own text;
+        # plain dicts keep copy semantics
+        if isinstance(resume, CandidateRecord):
+            record = resume
+            record.cleaned = True
+        else:
+            record = resume.copy()
+            record["clean_text"] = clean_resume(resume.get("full_text", "") or resume.get("raw", ""))
+        record.update({
+            "email": email,
+            "phone": phone,
+            "recruiter_score": recruiter_score,
+            "recruiter_feedback": recruiter_feedback_text
+        })
+        record.pop("full_text", None)  # clean_text carries the whole resume from here on
+        enriched.append(record)
     return enriched
 
 # 🗂️ Batch processor
@@ -79,7 +106,7 @@ def batch_process_recruiter():
     with open(INPUT_FILE, "r", encoding="utf-8") as f:
         parsed_resumes = json.load(f)
 
-    enriched_resumes = [recruiter_agent(resume) for resume in parsed_resumes]
+    enriched_resumes = batch_recruiter_agent(parsed_resumes)
 
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
         json.dump(enriched_resumes, f, indent=2)
@@ -1,17 +1,16 @@
 import streamlit as st
+import time
 from pathlib import Path
-import shutil
-import json
-import pandas as pd
-import re
-from fpdf import FPDF
-import base64
-
-from utils.resume_parser import batch_parse_resumes
-from agents.recruiter_agent import batch_process_recruiter
-from agents.analyst_agent import batch_process_analyst
-from agents.hr_agent import batch_process_hr
-from agents.recommender_agent import batch_process_recommender
+
+from agents.analyst_agent import warm_up_model
+from agents.pipeline import run_screening_job
+from agents.recommender_agent import top_k_resumes
+from resume_screener import extract_name_from_text
+from utils.job_queue import FAILED, QUEUED, RUNNING, JobQueue
+from utils.metrics import METRICS_LOG
+from utils.buffer_store import upload_store
+from utils.resume_parser import warm_up_nlp
+from utils.workspace import Workspace
 
 # Set page config FIRST
 st.set_page_config(page_title="AI Resume Screener", layout="wide")
@@ -45,11 +44,110 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Paths
-PROJECT_ROOT = Path(__file__).resolve().parent
-RESUME_FOLDER = PROJECT_ROOT / "data" / "resumes"
-JD_FOLDER = PROJECT_ROOT / "data" / "job_descriptions"
-FINAL_OUTPUT = PROJECT_ROOT / "data" / "final_recommendations.json"
+# Progress message shown while each pipeline stage runs
+STAGE_MESSAGES = {
+    "parse": "🔍 Parsing resumes...",
+    "recruiter": "📧 Extracting contact info...",
+    "analyst": "📊 Matching resumes to job description...",
+    "hr": "💬 Analyzing soft skills and red flags...",
+    "recommender": "🎯 Ranking top candidates...",
+}
+
+
+# Load the embedding and spaCy models in the background once per server process
+@st.cache_resource
+def start_model_warm_up():
+    return [warm_up_model(), warm_up_nlp()]
+
+
+start_model_warm_up()
+
+
+# Background workers shared by every session in this server process
+@st.cache_resource
+def get_job_queue():
+    return JobQueue(run_screening_job).start()
+
+
+def job_in_progress():
+    job_info = st.session_state.get("job")
+    if not job_info:
+        return False
+    job = get_job_queue().get(job_info["id"])
+    return job is not None and job["status"] in (QUEUED, RUNNING)
+
+
+# Each browser session screens in its own workspace so concurrent users never share files
+def get_workspace():
+    if "workspace_id" not in st.session_state:
+        st.session_state["workspace_id"] = Workspace().id
+    return Workspace(st.session_state["workspace_id"])
+
+
+# Expanders with per-agent scores for the top 5, plus a CSV download
+#    key keeps widget ids unique; label only names the download
+def render_top_candidates(data, upload_key, key="top", label=None):
+    import pandas as pd
+
+    # Jobs already return a ranked top-K; the bounded heap just guards the display limit
+    data = top_k_resumes(data, 5)
+    top_5 = pd.DataFrame(data)
+    top_5["Candidate"] = [extract_name_from_text(record.get("raw") or "", record.get("file_name")) for record in data]
+
+    # Display top candidates
+    st.success("Top 5 Recommended Candidates")
+
+    for _, row in top_5.iterrows():
+        with st.expander(f"🧑 {row['Candidate']} - Final Score: {round(row['recommendation_score'], 2)}"):
+            st.markdown(f"""
+                <div style='background-color:#1e293b; padding: 10px; border-radius: 10px;'>
+                <b style='color:#60a5fa;'>Recruiter:</b> {round(row.get("recruiter_score", 0), 2)}<br>
+                <b style='color:#818cf8;'>Analyst:</b> {round(row.get("analyst_score", 0), 2)}<br>
+                <b style='color:#f472b6;'>HR:</b> {round(row.get("hr_score", 0), 2)}<br>
+                <b style='color:#10b981;'>Total:</b> {round(row['recommendation_score'], 2)}
+                </div>
+            """, unsafe_allow_html=True)
+
+            st.markdown(f"📧 **Email:** `{row['email']}`")
+            st.markdown(f"📞 **Phone:** `{row['phone']}`")
+            st.markdown(f"🧠 **Skills:** {', '.join(row.get('skills', []))}")
+            st.markdown(f"💬 **Soft Skills:** {', '.join(row.get('soft_skills', [])) or 'None'}")
+            st.markdown(f"⚠️ **Red Flags:** {', '.join(row.get('red_flags', [])) or 'None'}")
+            st.markdown(f"📝 **Feedback:** {row.get('feedback', 'No feedback generated.')}")
+
+            # Served from the upload buffer by Streamlit's media endpoint, not inlined into the page
+            upload = upload_store.get_file(upload_key, row["file_name"])
+            if upload is not None:
+                st.download_button("📎 Download Resume", upload.data, row["file_name"],
+                                   key=f"resume_{key}_{row['file_name']}")
+
+    # CSV Download
+    csv = top_5.to_csv(index=False).encode("utf-8")
+    st.download_button("⬇️ Download CSV", csv, f"{label or key}_candidates.csv", "text/csv", key=f"csv_{key}")
+
+
+# Where the screening time went: per-stage timings, cache hit rates, model loads and slowest documents
+def render_timings(metrics):
+    import pandas as pd
+
+    with st.expander(f"⏱️ Timing: {metrics['wall_seconds']:.2f}s total"):
+        stages = pd.DataFrame.from_dict(metrics["stages"], orient="index")
+        st.dataframe(stages, use_container_width=True)
+
+        columns = st.columns(2)
+        with columns[0]:
+            st.markdown("**Caches**")
+            if metrics["caches"]:
+                st.dataframe(pd.DataFrame.from_dict(metrics["caches"], orient="index"), use_container_width=True)
+        with columns[1]:
+            st.markdown("**Model load times**")
+            if metrics["models"]:
+                st.dataframe(pd.DataFrame.from_dict(metrics["models"], orient="index"), use_container_width=True)
+
+        if metrics["documents"]:
+            st.markdown("**Slowest documents**")
+            st.dataframe(pd.DataFrame.from_dict(metrics["documents"], orient="index"), use_container_width=True)
+
 
 st.title("AI Resume Screener & Recommender")
 st.markdown("Upload resumes and paste a job description to get the top matched candidates.")
@@ -62,94 +160,101 @@ resume_files = st.file_uploader("Upload resumes (PDF or DOCX)", type=["pdf", "do
 if resume_files:
     st.success(f"✅ {len(resume_files)} resume(s) uploaded.")
 
-# Paste JD
-st.subheader("Paste Job Description")
-jd_text_input = st.text_area("Paste the job description below:", height=200)
+# Job description(s)
+mode = st.radio("Screening mode", ["Single job description", "Multiple job descriptions"], horizontal=True)
+multi_jd = mode == "Multiple job descriptions"
+
+if multi_jd:
+    st.subheader("Upload Job Descriptions")
+    jd_files = st.file_uploader("Upload job descriptions (TXT, one per opening)", type=["txt"], accept_multiple_files=True)
+    # Keyed by upload position, so files with the same name never overwrite each other; names are only shown
+    jd_texts, jd_labels = {}, {}
+    for position, jd in enumerate(jd_files or []):
+        text = jd.getvalue().decode("utf-8", errors="ignore").strip()
+        if text:
+            jd_texts[f"jd_{position}"] = text
+            jd_labels[f"jd_{position}"] = jd.name.rsplit(".", 1)[0]
+else:
+    st.subheader("Paste Job Description")
+    jd_text_input = st.text_area("Paste the job description below:", height=200)
+    jd_texts = {"top": jd_text_input.strip()} if jd_text_input.strip() else {}
+    jd_labels = {}
+    stream_results = st.checkbox("Stream every result to disk (for very large batches; only the top 5 are kept in memory)")
 
 st.divider()
 
 # Run Screening Pipeline
 if st.button("Run Screening Pipeline"):
-    if not resume_files or not jd_text_input.strip():
-        st.warning("⚠️ Please upload resumes and paste a job description.")
+    if not resume_files or not jd_texts:
+        st.warning("⚠️ Please upload resumes and provide a job description.")
+    elif job_in_progress():
+        st.info("⏳ A screening job from this session is still running.")
+    else:
+        # Uploads stay in memory: the job extracts from these buffers and downloads are served from them
+        workspace = get_workspace()
+        upload_store.put(workspace.id, {resume.name: resume.getvalue() for resume in resume_files})
+
+        params = {
+            "upload_key": workspace.id,
+            "manifest_file": str(workspace.manifest_file),
+            "top_k": 5,
+            "metrics_log": str(METRICS_LOG),
+        }
+        if multi_jd:
+            params["jd_texts"] = jd_texts
+        else:
+            params["jd_text"] = jd_texts["top"]
+            if stream_results:
+                params["results_file"] = str(workspace.folder / "results.jsonl")
+
+        # Screening runs on a background worker; this session only polls for progress
+        st.session_state["job"] = {
+            "id": get_job_queue().submit(params),
+            "multi_jd": multi_jd,
+            "jd_labels": jd_labels,
+            "upload_key": workspace.id,
+            "results_file": params.get("results_file"),
+        }
+
+# Poll the current job and display results
+job_info = st.session_state.get("job")
+if job_info:
+    job = get_job_queue().get(job_info["id"])
+    if job is None:
+        st.error("❌ Screening job not found.")
+    elif job["status"] in (QUEUED, RUNNING):
+        st.info("⏳ Screening job queued..." if job["status"] == QUEUED else "⏳ Screening in progress...")
+        for stage, counts in job["progress"].items():
+            fraction = counts["done"] / counts["total"] if counts["total"] else 1.0
+            st.progress(fraction, text=f"{STAGE_MESSAGES[stage]} {counts['done']}/{counts['total']}")
+        time.sleep(1)
+        st.rerun()
+    elif job["status"] == FAILED:
+        st.error(f"❌ Screening failed: {job['error']}")
     else:
-        shutil.rmtree(RESUME_FOLDER, ignore_errors=True)
-        shutil.rmtree(JD_FOLDER, ignore_errors=True)
-        RESUME_FOLDER.mkdir(parents=True, exist_ok=True)
-        JD_FOLDER.mkdir(parents=True, exist_ok=True)
-
-        for resume in resume_files:
-            with open(RESUME_FOLDER / resume.name, "wb") as f:
-                f.write(resume.read())
-
-        with open(JD_FOLDER / "job_description.txt", "w", encoding="utf-8") as f:
-            f.write(jd_text_input.strip())
-
-        # Run each agent
-        with st.spinner("🔍 Parsing resumes..."):
-            batch_parse_resumes()
-        with st.spinner("📧 Extracting contact info..."):
-            batch_process_recruiter()
-        with st.spinner("📊 Matching resumes to job description..."):
-            batch_process_analyst()
-        with st.spinner("💬 Analyzing soft skills and red flags..."):
-            batch_process_hr()
-        with st.spinner("🎯 Ranking top candidates..."):
-            batch_process_recommender()
-
-        # Display results
-        if FINAL_OUTPUT.exists():
-            with open(FINAL_OUTPUT, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            df = pd.DataFrame(data)
-
-            def extract_name_from_text(raw_text, fallback):
-                lines = raw_text.strip().split("\n")[:5]
-                common_headings = {"Professional Summary", "Objective", "Experience", "Skills", "Education"}
-                for line in lines:
-                    if line.strip() in common_headings:
-                        continue
-                    if re.match(r"^[A-Z][a-z]+ [A-Z][a-z]+$", line.strip()):
-                        return line.strip()
-                return fallback
-
-            df["Candidate"] = df.apply(
-                lambda row: extract_name_from_text(row.get("raw", ""), row.get("file_name")),
-                axis=1
-            )
-
-            # Display top candidates
-            st.success("Top 5 Recommended Candidates")
-            top_5 = df.sort_values(by="recommendation_score", ascending=False).head(5)
-
-            for _, row in top_5.iterrows():
-                with st.expander(f"🧑 {row['Candidate']} - Final Score: {round(row['recommendation_score'], 2)}"):
-                    st.markdown(f"""
-                        <div style='background-color:#1e293b; padding: 10px; border-radius: 10px;'>
-                        <b style='color:#60a5fa;'>Recruiter:</b> {round(row.get("recruiter_score", 0), 2)}<br>
-                        <b style='color:#818cf8;'>Analyst:</b> {round(row.get("analyst_score", 0), 2)}<br>
-                        <b style='color:#f472b6;'>HR:</b> {round(row.get("hr_score", 0), 2)}<br>
-                        <b style='color:#10b981;'>Total:</b> {round(row['recommendation_score'], 2)}
-                        </div>
-                    """, unsafe_allow_html=True)
-
-                    st.markdown(f"📧 **Email:** `{row['email']}`")
-                    st.markdown(f"📞 **Phone:** `{row['phone']}`")
-                    st.markdown(f"🧠 **Skills:** {', '.join(row.get('skills', []))}")
-                    st.markdown(f"💬 **Soft Skills:** {', '.join(row.get('soft_skills', [])) or 'None'}")
-                    st.markdown(f"⚠️ **Red Flags:** {', '.join(row.get('red_flags', [])) or 'None'}")
-                    st.markdown(f"📝 **Feedback:** {row.get('feedback', 'No feedback generated.')}")
-
-                    resume_path = RESUME_FOLDER / row["file_name"]
-                    if resume_path.exists():
-                        with open(resume_path, "rb") as f:
-                            resume_data = base64.b64encode(f.read()).decode()
-                            href = f'<a href="data:application/octet-stream;base64,{resume_data}" download="{row["file_name"]}">📎 Download Resume</a>'
-                            st.markdown(href, unsafe_allow_html=True)
-
-            # CSV Download
-            csv = top_5.to_csv(index=False).encode("utf-8")
-            st.download_button("⬇️ Download CSV", csv, "top_candidates.csv", "text/csv")
+        candidates = job["result"]["candidates"]
+        rankings = candidates if job_info["multi_jd"] else {"top": candidates}
+        if any(rankings.values()):
+            if job_info["multi_jd"]:
+                labels = [job_info["jd_labels"].get(key, key) for key in rankings]
+                # Two uploads may share a name; number the repeats so each tab can be told apart
+                labels = [label if labels.count(label) == 1 else f"{label} ({labels[:i].count(label) + 1})"
+                          for i, label in enumerate(labels)]
+                tabs = st.tabs(labels)
+                for tab, label, (key, data) in zip(tabs, labels, rankings.items()):
+                    with tab:
+                        if data:
+                            render_top_candidates(data, job_info["upload_key"], key=key, label=label)
+            else:
+                render_top_candidates(rankings["top"], job_info["upload_key"])
+
+            results_file = Path(job_info["results_file"]) if job_info.get("results_file") else None
+            if results_file and results_file.exists():
+                with open(results_file, "rb") as f:
+                    st.download_button("⬇️ Download all results (JSON Lines)", f, "all_candidates.jsonl",
+                                       "application/jsonl", key="all_results")
 
         else:
-            st.error("❌ No output file found.")
+            st.error("❌ No resumes could be screened.")
+
+        render_timings(job["result"]["metrics"])
@@ -0,0 +1,180 @@
+import sys
+import json
+import time
+import argparse
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic_corpus import BENCHMARK_DIR, SCALES, generate_corpus, parse_scale
+from utils.lazy import LazyModel
+from utils.embedding_cache import EmbeddingCache
+from utils.resume_parser import extract_text, list_resume_files
+from agents import analyst_agent as analyst
+from agents.recruiter_agent import clean_resume
+from agents.pipeline import TOP_K
+
+# 📁 Path setup
+RESULTS_DIR = BENCHMARK_DIR / "accuracy"
+
+# ⚙️ Limits a backend must stay within against the float32 baseline
+MAX_MEAN_SCORE_DIFF = 1.0    # analyst score points (out of 100), averaged over every resume/JD pair
+MAX_SCORE_DIFF = 5.0         # worst single resume/JD pair
+MIN_RANK_CORRELATION = 0.98  # Spearman correlation of the resume ranking, worst JD
+MIN_TOP_K_OVERLAP = 0.8      # share of the baseline top K the backend also ranks top K, worst JD
+
+# 📥 Resume texts (as the analyst sees them) and JD texts from a corpus folder
+def load_texts(corpus_dir: Path):
+    corpus_dir = Path(corpus_dir)
+    resume_texts = []
+    for file in list_resume_files(corpus_dir / "resumes"):
+        try:
+            resume_texts.append(clean_resume(extract_text(file)))
+        except ValueError as e:
+            print(f"⚠️ Skipping {file.name}: {e}")
+    jd_texts = [jd_file.read_text(encoding="utf-8") for jd_file in sorted((corpus_dir / "job_descriptions").glob("*.txt"))]
+    if not resume_texts or not jd_texts:
+        raise FileNotFoundError(f"No resumes or job descriptions in {corpus_dir}")
+    return resume_texts, jd_texts
+
+# ⏱️ M×N analyst scores and encoding throughput for one backend; a throwaway cache keeps every run cold
+def score_with_backend(backend, resume_texts, jd_texts, batch_size=analyst.BATCH_SIZE):
+    analyst.use_backend(backend)
+    analyst.model.get()  # load/export time is reported separately
+    chunks, _ = analyst.chunk_resumes(resume_texts)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        analyst.embedding_cache = LazyModel(
+            "embedding cache", lambda: EmbeddingCache(analyst.cache_name(backend), cache_dir=Path(cache_dir))
+        )
+        start = time.perf_counter()
+        matrix = analyst.compute_analyst_matrix(resume_texts, jd_texts, batch_size=batch_size)
+        seconds = time.perf_counter() - start
+    texts = len(chunks) + len(jd_texts)
+    print(f"⏱️ {backend}: {texts} texts in {seconds:.2f}s ({texts / seconds:.1f}/s)")
+    return matrix, {
+        "backend": backend,
+        "load_seconds": round(analyst.model.load_seconds, 3),
+        "seconds": round(seconds, 4),
+        "texts": texts,
+        "texts_per_s": round(texts / seconds, 2),
+    }
+
+# 📊 Ranks with ties averaged, so equal scores do not depend on sort order
+def average_ranks(values):
+    ranks = np.empty(len(values), dtype=np.float64)
+    ranks[np.argsort(values, kind="stable")] = np.arange(len(values))
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    return (np.bincount(inverse, weights=ranks) / counts)[inverse]
+
+def rank_correlation(a, b):
+    if len(a) < 2:
+        return 1.0
+    ra, rb = average_ranks(a), average_ranks(b)
+    if ra.std() == 0 or rb.std() == 0:
+        return 1.0 if np.array_equal(ra, rb) else 0.0
+    return float(np.corrcoef(ra, rb)[0, 1])
+
+def top_k_overlap(a, b, k):
+    k = min(k, len(a))
+    if k == 0:
+        return 1.0
+    return len(set(np.argsort(-a, kind="stable")[:k]) & set(np.argsort(-b, kind="stable")[:k])) / k
+
+# ⚖️ How far a backend's scores and rankings drift from the baseline's (both M×N)
+def compare_scores(baseline, candidate, top_k=TOP_K):
+    diff = np.abs(np.asarray(candidate, dtype=np.float64) - np.asarray(baseline, dtype=np.float64))
+    per_jd = [
+        {
+            "rank_correlation": round(rank_correlation(baseline[:, col], candidate[:, col]), 4),
+            "top_k_overlap": round(top_k_overlap(baseline[:, col], candidate[:, col], top_k), 3),
+        }
+        for col in range(baseline.shape[1])
+    ]
+    labels_changed = sum(
+        analyst.analyst_feedback(before) != analyst.analyst_feedback(after)
+        for before, after in zip(baseline.ravel().tolist(), candidate.ravel().tolist())
+    )
+    return {
+        "mean_abs_score_diff": round(float(diff.mean()), 4),
+        "max_abs_score_diff": round(float(diff.max()), 4),
+        "min_rank_correlation": min(jd["rank_correlation"] for jd in per_jd),
+        "min_top_k_overlap": min(jd["top_k_overlap"] for jd in per_jd),
+        "feedback_labels_changed": labels_changed,
+        "per_jd": per_jd,
+    }
+
+# ✅ Limits the comparison breaks (empty when the backend is accurate enough)
+def accuracy_failures(comparison):
+    checks = [
+        ("mean_abs_score_diff", comparison["mean_abs_score_diff"] <= MAX_MEAN_SCORE_DIFF, f"<= {MAX_MEAN_SCORE_DIFF}"),
+        ("max_abs_score_diff", comparison["max_abs_score_diff"] <= MAX_SCORE_DIFF, f"<= {MAX_SCORE_DIFF}"),
+        ("min_rank_correlation", comparison["min_rank_correlation"] >= MIN_RANK_CORRELATION, f">= {MIN_RANK_CORRELATION}"),
+        ("min_top_k_overlap", comparison["min_top_k_overlap"] >= MIN_TOP_K_OVERLAP, f">= {MIN_TOP_K_OVERLAP}"),
+    ]
+    return [f"{name} = {comparison[name]} (needs {limit})" for name, passed, limit in checks if not passed]
+
+# 🏁 Score the corpus with the baseline and the backend, then compare scores, rankings and speed
+def check_backend(corpus_dir: Path, backend: str, baseline: str = "torch", top_k: int = TOP_K,
+                  batch_size: int = analyst.BATCH_SIZE):
+    resume_texts, jd_texts = load_texts(corpus_dir)
+    previous = analyst.BACKEND
+    try:
+        expected, baseline_speed = score_with_backend(baseline, resume_texts, jd_texts, batch_size=batch_size)
+        actual, backend_speed = score_with_backend(backend, resume_texts, jd_texts, batch_size=batch_size)
+    finally:
+        analyst.use_backend(previous)
+
+    comparison = compare_scores(expected, actual, top_k=top_k)
+    failures = accuracy_failures(comparison)
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "corpus": str(corpus_dir),
+        "resumes": len(resume_texts),
+        "job_descriptions": len(jd_texts),
+        "baseline": baseline_speed,
+        "candidate": backend_speed,
+        "speedup": round(backend_speed["texts_per_s"] / baseline_speed["texts_per_s"], 2),
+        "accuracy": comparison,
+        "passed": not failures,
+        "failures": failures,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check an analyst inference backend against the float32 baseline.")
+    parser.add_argument("--backend", required=True, choices=list(analyst.BACKENDS), help="Backend to check")
+    parser.add_argument("--baseline", default="torch", choices=list(analyst.BACKENDS), help="Reference backend")
+    parser.add_argument("--scale", type=parse_scale, default=SCALES["100"], help=f"{', '.join(SCALES)} or a number of resumes")
+    parser.add_argument("--corpus", type=Path, help="Existing corpus folder (skips generation)")
+    parser.add_argument("--jds", type=int, default=3, help="Job descriptions to generate")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--top-k", type=int, default=TOP_K)
+    parser.add_argument("-o", "--output", type=Path, help="Result JSON (default: data/benchmarks/accuracy/<backend>_<time>.json)")
+    args = parser.parse_args(argv)
+
+    corpus_dir = args.corpus or generate_corpus(args.scale, jd_count=args.jds, seed=args.seed)
+    result = check_backend(corpus_dir, args.backend, baseline=args.baseline, top_k=args.top_k)
+
+    accuracy = result["accuracy"]
+    print(f"📊 {args.backend} vs {args.baseline}: {result['speedup']}x throughput, "
+          f"mean score diff {accuracy['mean_abs_score_diff']}, max {accuracy['max_abs_score_diff']}, "
+          f"rank correlation >= {accuracy['min_rank_correlation']}, top-{args.top_k} overlap >= {accuracy['min_top_k_overlap']}, "
+          f"{accuracy['feedback_labels_changed']} feedback labels changed")
+
+    output_file = args.output or RESULTS_DIR / f"{args.backend}_{datetime.now():%Y%m%d_%H%M%S}.json"
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    print(f"✅ Accuracy report saved to {output_file}")
+
+    if not result["passed"]:
+        print(f"❌ {args.backend} is outside the accuracy limits: {'; '.join(result['failures'])}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic_corpus import BENCHMARK_DIR, SCALES, generate_corpus, parse_scale
+from utils.lazy import LazyModel
+from utils.embedding_cache import EmbeddingCache
+from utils.resume_parser import NLP_BATCH_SIZE, extract_text, list_resume_files, parse_resumes
+from agents import analyst_agent as analyst
+from agents.recruiter_agent import batch_recruiter_agent
+from agents.hr_agent import batch_hr_agent
+from agents.recommender_agent import batch_recommender_agent
+from agents.pipeline import STREAM_BATCH_SIZE, iter_batches
+
+# 📁 Path setup
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = BENCHMARK_DIR / "results"
+
+# ⚙️ Throughput drop (as a fraction) that --compare reports as a regression
+REGRESSION_TOLERANCE = 0.10
+
+# 📈 Peak resident set size of the whole process so far, in MB (None where unavailable)
+def process_peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+# 📈 Linux lets a process reset its resident high-water mark (VmHWM), so each stage can report its own peak.
+#    Returns False where that is unsupported; stages then report no peak rather than the process's.
+def reset_peak_rss():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+# 📈 VmRSS (current) or VmHWM (peak since the last reset) from /proc, in MB (None where unavailable)
+def proc_rss_mb(field="VmRSS"):
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith(f"{field}:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+# ⏱️ Run fn over items in batches. Latency percentiles are per fn call, i.e. per batch of batch_size items
+#    (per item only where batch_size is 1); item_mean_ms is the stage time divided by its items.
+def time_stage(name, items, fn, batch_size=1):
+    outputs, latencies = [], []
+    rss_before = proc_rss_mb()
+    peak_tracked = reset_peak_rss()
+    start = time.perf_counter()
+    for batch in iter_batches(items, batch_size):
+        batch_start = time.perf_counter()
+        outputs.extend(fn(batch))
+        latencies.append(time.perf_counter() - batch_start)
+    seconds = time.perf_counter() - start
+    rss_after = proc_rss_mb()
+
+    latencies_ms = np.array(latencies) * 1000 if latencies else np.zeros(1)
+    metrics = {
+        "stage": name,
+        "items": len(items),
+        "batch_size": batch_size,
+        "batches": len(latencies),
+        "seconds": round(seconds, 4),
+        "throughput_per_s": round(len(items) / seconds, 2) if seconds else None,
+        "item_mean_ms": round(seconds * 1000 / len(items), 3) if items else None,
+        "batch_p50_ms": round(float(np.percentile(latencies_ms, 50)), 3),
+        "batch_p95_ms": round(float(np.percentile(latencies_ms, 95)), 3),
+        "peak_rss_mb": proc_rss_mb("VmHWM") if peak_tracked else None,
+        "rss_delta_mb": round(rss_after - rss_before, 1) if rss_before is not None and rss_after is not None else None,
+    }
+    print(f"⏱️ {name}: {metrics['items']} items in {metrics['seconds']}s ({metrics['throughput_per_s']}/s, "
+          f"{metrics['item_mean_ms']}ms/item, batch of {batch_size} p50 {metrics['batch_p50_ms']}ms "
+          f"p95 {metrics['batch_p95_ms']}ms, peak {metrics['peak_rss_mb']}MB)")
+    return outputs, metrics
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# 🏁 Time every stage over the corpus, one after another, feeding each stage the previous stage's output
+def run_benchmark(corpus_dir: Path, jd_index: int = 0, backend: str = None):
+    corpus_dir = Path(corpus_dir)
+    if backend:
+        analyst.use_backend(backend)
+    files = list_resume_files(corpus_dir / "resumes")
+    jd_files = sorted((corpus_dir / "job_descriptions").glob("*.txt"))
+    if not files or not jd_files:
+        raise FileNotFoundError(f"No resumes or job descriptions in {corpus_dir}")
+    jd_text = jd_files[jd_index].read_text(encoding="utf-8")
+
+    # Model loading is reported separately so it does not skew the first batch
+    load_start = time.perf_counter()
+    analyst.model.get()
+    list(parse_resumes(["warm up"]))
+    load_seconds = round(time.perf_counter() - load_start, 4)
+    load_peak_rss_mb = proc_rss_mb("VmHWM")
+
+    # A throwaway embedding cache keeps every run cold and leaves the real cache alone
+    with tempfile.TemporaryDirectory() as cache_dir:
+        analyst.embedding_cache = LazyModel(
+            "embedding cache", lambda: EmbeddingCache(analyst.cache_name(), cache_dir=Path(cache_dir))
+        )
+        jd_embed = analyst.embed_jd(jd_text)
+
+        stages = []
+        texts, metrics = time_stage("extract_text", files, lambda batch: [extract_text(f) for f in batch])
+        stages.append(metrics)
+        parsed, metrics = time_stage("parse_resume", texts, lambda batch: parse_resumes(batch), NLP_BATCH_SIZE)
+        stages.append(metrics)
+        enriched, metrics = time_stage("recruiter_agent", parsed, batch_recruiter_agent, STREAM_BATCH_SIZE)
+        stages.append(metrics)
+        scored, metrics = time_stage(
+            "analyst_agent", enriched,
+            lambda batch: analyst.batch_analyst_agent(batch, jd_text, jd_embed=jd_embed), analyst.BATCH_SIZE,
+        )
+        stages.append(metrics)
+        screened, metrics = time_stage("hr_agent", scored, batch_hr_agent, STREAM_BATCH_SIZE)
+        stages.append(metrics)
+        _, metrics = time_stage("recommender_agent", screened, batch_recommender_agent, STREAM_BATCH_SIZE)
+        stages.append(metrics)
+
+    # Stage peaks reset the process high-water mark, so the run's peak is the largest of them
+    peaks = [peak for peak in [load_peak_rss_mb] + [stage["peak_rss_mb"] for stage in stages] if peak is not None]
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "corpus": str(corpus_dir),
+        "resumes": len(files),
+        "analyst_backend": analyst.BACKEND,
+        "model_load_seconds": load_seconds,
+        "total_seconds": round(sum(stage["seconds"] for stage in stages), 4),
+        "peak_rss_mb": max(peaks) if peaks else process_peak_rss_mb(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "stages": stages,
+    }
+
+# ⚖️ Per-stage throughput change against a baseline result; returns the stages that regressed
+def compare_results(baseline: dict, current: dict, tolerance: float = REGRESSION_TOLERANCE) -> list:
+    previous = {stage["stage"]: stage for stage in baseline.get("stages", [])}
+    regressed = []
+    for stage in current["stages"]:
+        before = previous.get(stage["stage"])
+        if not before or not before.get("throughput_per_s") or not stage.get("throughput_per_s"):
+            continue
+        change = stage["throughput_per_s"] / before["throughput_per_s"] - 1
+        marker = "⚠️" if change < -tolerance else "✅"
+        print(f"{marker} {stage['stage']}: {before['throughput_per_s']}/s -> {stage['throughput_per_s']}/s ({change:+.1%})")
+        if change < -tolerance:
+            regressed.append(stage["stage"])
+    return regressed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every screening stage on a synthetic corpus.")
+    parser.add_argument("--scale", type=parse_scale, default=SCALES["100"], help=f"{', '.join(SCALES)} or a number of resumes")
+    parser.add_argument("--corpus", type=Path, help="Existing corpus folder (skips generation)")
+    parser.add_argument("--pdf-ratio", type=float, default=0.5, help="Share of generated resumes written as PDF")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--backend", choices=list(analyst.BACKENDS), help="Analyst inference backend")
+    parser.add_argument("-o", "--output", type=Path, help="Result JSON (default: data/benchmarks/results/<scale>_<time>.json)")
+    parser.add_argument("--compare", type=Path, help="Baseline result JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE, help="Allowed throughput drop before failing")
+    args = parser.parse_args(argv)
+
+    corpus_dir = args.corpus or generate_corpus(args.scale, pdf_ratio=args.pdf_ratio, seed=args.seed)
+    result = run_benchmark(corpus_dir, backend=args.backend)
+
+    output_file = args.output or RESULTS_DIR / f"{result['resumes']}_{datetime.now():%Y%m%d_%H%M%S}.json"
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    print(f"✅ Benchmark results saved to {output_file}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressed = compare_results(json.load(f), result, tolerance=args.tolerance)
+        if regressed:
+            print(f"❌ Throughput regressed in: {', '.join(regressed)}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+import sys
+import json
+import random
+import argparse
+from pathlib import Path
+
+# Add parent directory to sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from agents.hr_agent import SOFT_SKILLS, RED_FLAGS
+from utils.skills_extractor import load_skills_taxonomy
+
+# 📁 Path setup
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BENCHMARK_DIR = PROJECT_ROOT / "data" / "benchmarks"
+
+# ⚙️ Named corpus sizes
+SCALES = {"100": 100, "1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+FIRST_NAMES = ["Aarav", "Priya", "Liam", "Emma", "Noah", "Olivia", "Mateo", "Sofia", "Wei", "Mei",
+               "Omar", "Layla", "Lucas", "Chloe", "Kofi", "Ama", "Ivan", "Anya", "Diego", "Lucia"]
+LAST_NAMES = ["Sharma", "Patel", "Smith", "Johnson", "Garcia", "Martinez", "Chen", "Wang", "Hassan",
+              "Ali", "Silva", "Costa", "Mensah", "Owusu", "Petrov", "Ivanova", "Lopez", "Nguyen"]
+ROLES = ["Data Analyst", "Backend Developer", "Frontend Developer", "DevOps Engineer",
+         "Machine Learning Engineer", "Data Engineer", "Business Analyst", "QA Engineer"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Analytics", "Stark Industries",
+             "Wayne Enterprises", "Hooli", "Vandelay Imports", "Soylent Systems", "Tyrell Labs"]
+DEGREES = ["B.Sc. Computer Science", "B.Tech Information Technology", "M.Sc. Data Science",
+           "B.Com Finance", "M.Tech Software Engineering", "B.Sc. Statistics"]
+VERBS = ["Built", "Designed", "Maintained", "Automated", "Led", "Optimized", "Migrated", "Analyzed"]
+OBJECTS = ["reporting dashboards", "ETL pipelines", "REST APIs", "CI/CD workflows", "data models",
+           "customer churn models", "microservices", "monitoring alerts", "A/B test analyses"]
+OUTCOMES = ["cutting runtime by 40%", "serving 2M daily users", "saving 12 hours a week",
+            "reducing incidents by a third", "improving forecast accuracy by 15%", "on a tight deadline"]
+
+# 👤 One synthetic resume as (name, sections); the rng makes the corpus reproducible
+def make_resume(rng: random.Random, skills: list):
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    role = rng.choice(ROLES)
+    picked = rng.sample(skills, k=min(len(skills), rng.randint(4, 12)))
+    soft = rng.sample(sorted(SOFT_SKILLS), k=rng.randint(1, 4))
+    flags = rng.sample(sorted(RED_FLAGS), k=1) if rng.random() < 0.15 else []
+
+    # A few long resumes so the chunked embedding path gets exercised
+    jobs = rng.randint(1, 4) if rng.random() < 0.9 else rng.randint(8, 15)
+    experience = []
+    for _ in range(jobs):
+        bullets = [f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(picked)}, {rng.choice(OUTCOMES)}."
+                   for _ in range(rng.randint(2, 5))]
+        experience.append((f"{role} - {rng.choice(COMPANIES)} ({rng.randint(2010, 2024)})", bullets))
+
+    summary = f"{role} with {rng.randint(1, 15)} years of experience. Known for {', '.join(soft)}."
+    if flags:
+        summary += f" Note: {flags[0]} in recent history."
+
+    return name, [
+        ("Contact", [f"{name.lower().replace(' ', '.')}@example.com", f"+1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}"]),
+        ("Summary", [summary]),
+        ("Skills", [", ".join(picked)]),
+        *[(title, bullets) for title, bullets in experience],
+        ("Education", [rng.choice(DEGREES)]),
+    ]
+
+# 📝 One synthetic job description
+def make_jd(rng: random.Random, skills: list) -> str:
+    role = rng.choice(ROLES)
+    required = rng.sample(skills, k=min(len(skills), rng.randint(4, 8)))
+    soft = rng.sample(sorted(SOFT_SKILLS), k=2)
+    return (
+        f"We are hiring a {role} to join our team at {rng.choice(COMPANIES)}.\n\n"
+        f"*Key Responsibilities:*\n"
+        + "".join(f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)}\n" for _ in range(4))
+        + f"\n*Required Skills:*\n" + "".join(f"- {skill}\n" for skill in required)
+        + f"\n*Soft Skills:*\n" + "".join(f"- {skill}\n" for skill in soft)
+    )
+
+def write_docx(path: Path, name: str, sections: list):
+    from docx import Document
+
+    document = Document()
+    document.add_heading(name, level=1)
+    for title, lines in sections:
+        document.add_heading(title, level=2)
+        for line in lines:
+            document.add_paragraph(line)
+    document.save(path)
+
+def write_pdf(path: Path, name: str, sections: list):
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", "B", 16)
+    pdf.cell(0, 10, name, ln=True)
+    for title, lines in sections:
+        pdf.set_font("Arial", "B", 12)
+        pdf.cell(0, 8, title, ln=True)
+        pdf.set_font("Arial", size=10)
+        for line in lines:
+            pdf.multi_cell(0, 5, line)
+    pdf.output(str(path))
+
+# 🏭 Write `count` resumes (a pdf_ratio share as PDF, the rest as DOCX) and `jd_count` JDs
+#    Files that already exist are kept, so re-running with the same seed only fills gaps.
+def generate_corpus(count: int, jd_count: int = 3, pdf_ratio: float = 0.5, seed: int = 42, out_dir: Path = None) -> Path:
+    out_dir = Path(out_dir or BENCHMARK_DIR / f"corpus_{count}_seed{seed}")
+    resume_folder = out_dir / "resumes"
+    jd_folder = out_dir / "job_descriptions"
+    resume_folder.mkdir(parents=True, exist_ok=True)
+    jd_folder.mkdir(parents=True, exist_ok=True)
+
+    skills = sorted(load_skills_taxonomy())
+    rng = random.Random(seed)
+    written = 0
+    for number in range(count):
+        name, sections = make_resume(rng, skills)
+        is_pdf = rng.random() < pdf_ratio
+        path = resume_folder / f"resume_{number:06d}.{'pdf' if is_pdf else 'docx'}"
+        if path.exists():
+            continue
+        (write_pdf if is_pdf else write_docx)(path, name, sections)
+        written += 1
+        if written % 1000 == 0:
+            print(f"📄 {written} resumes written...")
+
+    for number in range(jd_count):
+        jd_path = jd_folder / f"job_description_{number:02d}.txt"
+        jd_path.write_text(make_jd(rng, skills), encoding="utf-8")
+
+    with open(out_dir / "corpus.json", "w", encoding="utf-8") as f:
+        json.dump({"count": count, "jd_count": jd_count, "pdf_ratio": pdf_ratio, "seed": seed}, f, indent=2)
+
+    print(f"✅ Corpus ready at {out_dir} ({written} new resumes, {count} total, {jd_count} JDs)")
+    return out_dir
+
+def parse_scale(value: str) -> int:
+    if value in SCALES:
+        return SCALES[value]
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Unknown scale {value!r}; use {', '.join(SCALES)} or a number")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic resume corpus for benchmarking.")
+    parser.add_argument("--scale", type=parse_scale, default=SCALES["100"], help=f"{', '.join(SCALES)} or a number of resumes")
+    parser.add_argument("--jds", type=int, default=3, help="Number of job descriptions to generate")
+    parser.add_argument("--pdf-ratio", type=float, default=0.5, help="Share of resumes written as PDF")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("-o", "--output", type=Path, help="Corpus folder (default: data/benchmarks/corpus_<n>_seed<seed>)")
+    args = parser.parse_args(argv)
+    generate_corpus(args.scale, jd_count=args.jds, pdf_ratio=args.pdf_ratio, seed=args.seed, out_dir=args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import sys
+import argparse
+import csv
+import json
+import re
+from pathlib import Path
+
+# ✅ Imports
+from agents import analyst_agent
+from agents.pipeline import INDEX_MIN_RESUMES, TOP_K, run_incremental_pipeline, run_pipeline, run_streaming_pipeline
+from agents.recommender_agent import rank_key, top_k_resumes
+from utils import resume_parser
+from utils.resume_parser import SUPPORTED_SUFFIXES, list_resume_files
+from utils.metrics import PipelineMetrics
+from utils.manifest import hash_text
+from utils.candidate_record import to_plain
+from utils.result_store import ResultStore
+
+# 📁 Setup paths
+PROJECT_ROOT = Path(__file__).resolve().parent
+MANIFEST_DIR = PROJECT_ROOT / "data" / "manifests"
+
+# 🧭 --index choices: None lets the pipeline decide by pool size
+INDEX_MODES = {"auto": None, "always": True, "never": False}
+
+# 🗒️ Columns written in CSV output
+CSV_FIELDS = [
+    "rank", "candidate", "file_name", "recommendation_score", "recruiter_score", "analyst_score",
+    "hr_score", "email", "phone", "skills", "soft_skills", "red_flags", "recommendation_feedback",
+]
+
+# 🧑 Pick a "First Last" line near the top of the resume as the display name
+NAME_PATTERN = re.compile(r"^[A-Z][a-z]+ [A-Z][a-z]+$")
+COMMON_HEADINGS = {"Professional Summary", "Objective", "Experience", "Skills", "Education"}
+
+def extract_name_from_text(raw_text, fallback):
+    for line in raw_text.strip().split("\n", 5)[:5]:
+        line = line.strip()
+        if line not in COMMON_HEADINGS and NAME_PATTERN.match(line):
+            return line
+    return fallback
+
+# 📂 Expand files and folders into a de-duplicated list of resume files
+def collect_resume_files(paths):
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(list_resume_files(path))
+        elif path.suffix.lower() in SUPPORTED_SUFFIXES and path.exists():
+            files.append(path)
+        else:
+            print(f"⚠️ Skipping {path}: not a PDF/DOCX file or folder")
+    return list(dict.fromkeys(files))
+
+# 📒 One manifest per set of inputs, so screening one pool never prunes another pool's cached records
+def manifest_for(paths):
+    key = hash_text("\n".join(sorted(str(Path(path).resolve()) for path in paths)))
+    return MANIFEST_DIR / f"cli_{key[:16]}.json"
+
+# 🏆 Order by final score (file name breaks ties) and number the ranks
+def rank_candidates(records, top_k=None):
+    ranked = top_k_resumes(records, top_k) if top_k else sorted(records, key=rank_key)
+    for position, record in enumerate(ranked, start=1):
+        record["rank"] = position
+        record["candidate"] = extract_name_from_text(record.get("raw") or "", record.get("file_name"))
+    return ranked
+
+# 🚀 Screen resumes (files and/or folders) against a JD and return the ranked candidates
+def screen(resumes, jd_text, top_k=TOP_K, workers=resume_parser.MAX_WORKERS,
+           batch_size=analyst_agent.BATCH_SIZE, incremental=True, on_stage=None, metrics=None, metrics_log=None,
+           manifest_file=None, use_index=None):
+    files = collect_resume_files(resumes)
+    if not files:
+        print("❌ No resumes to screen.")
+        return []
+    options = {"jd_text": jd_text, "files": files, "workers": workers, "batch_size": batch_size,
+               "on_stage": on_stage, "metrics": metrics, "metrics_log": metrics_log}
+    if incremental:
+        records = run_incremental_pipeline(manifest_file=manifest_file or manifest_for(resumes), top_k=top_k or TOP_K,
+                                           use_index=use_index if top_k else False, **options)
+    else:
+        records = run_pipeline(**options)
+    return rank_candidates(records, top_k)
+
+# 🌊 Stream every result into a JSON Lines store (utils.result_store) instead of holding the pool in memory;
+#    returns the ranked top K. ranked=True writes the store in rank order, sorted on disk in spill chunks.
+def stream(resumes, jd_text, output_file, top_k=TOP_K, workers=resume_parser.MAX_WORKERS,
+           batch_size=analyst_agent.BATCH_SIZE, ranked=False, metrics=None, metrics_log=None):
+    files = collect_resume_files(resumes)
+    if not files:
+        print("❌ No resumes to screen.")
+        return []
+    top = run_streaming_pipeline(jd_text=jd_text, files=files, output_file=output_file, top_k=top_k or TOP_K,
+                                 workers=workers, batch_size=batch_size, ranked=ranked, metrics=metrics,
+                                 metrics_log=metrics_log)
+    return rank_candidates(top)
+
+# 💾 Write ranked candidates as JSON, CSV or an indexed JSON Lines store (utils.result_store)
+def write_results(ranked, output_file, fmt=None):
+    output_file = Path(output_file)
+    fmt = fmt or {".csv": "csv", ".jsonl": "jsonl"}.get(output_file.suffix.lower(), "json")
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "csv":
+        with open(output_file, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for record in ranked:
+                row = dict(record)
+                for field in ("skills", "soft_skills", "red_flags"):
+                    row[field] = ", ".join(row.get(field) or [])
+                writer.writerow(row)
+    elif fmt == "jsonl":
+        ResultStore(output_file).write(ranked)
+    else:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump([to_plain(record) for record in ranked], f, indent=2)
+    print(f"✅ Saved {len(ranked)} ranked candidates to {output_file}")
+
+# ⏱️ One line per stage: wall/CPU time, throughput and failures
+def print_metrics(summary):
+    print(f"⏱️ Total {summary['wall_seconds']}s")
+    for name, stage in summary["stages"].items():
+        failures = f", {stage['failures']} failed" if stage["failures"] else ""
+        print(f"   {name:<12} {stage['wall_seconds']:>9.3f}s wall {stage['cpu_seconds']:>9.3f}s cpu "
+              f"{stage['items']:>7} items ({stage['items_per_s']}/s{failures})")
+    for name, cache in summary["caches"].items():
+        print(f"   cache {name}: {cache['hits']} hits, {cache['misses']} misses")
+    for name, model in summary["models"].items():
+        if model["loaded_this_run"]:
+            print(f"   loaded {name} in {model['load_seconds']}s")
+
+# ⌨️ Command line entry point
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Screen resumes against a job description without the Streamlit UI.")
+    parser.add_argument("resumes", nargs="+", help="resume files (PDF/DOCX) and/or folders containing them")
+    parser.add_argument("--jd", required=True, help="job description text file")
+    parser.add_argument("-o", "--output", default="ranked_candidates.json", help="output file (.json, .csv or .jsonl)")
+    parser.add_argument("--format", choices=["json", "csv", "jsonl"], help="output format (default: from the file extension)")
+    parser.add_argument("--top-k", type=int, default=TOP_K, help="number of candidates to keep (0 keeps all)")
+    parser.add_argument("--workers", type=int, default=resume_parser.MAX_WORKERS, help="extraction processes")
+    parser.add_argument("--batch-size", type=int, default=analyst_agent.BATCH_SIZE, help="embedding batch size")
+    parser.add_argument("--backend", choices=list(analyst_agent.BACKENDS), default=analyst_agent.BACKEND,
+                        help="analyst inference backend (int8/onnx are faster on CPU; check with benchmarks/backend_accuracy.py)")
+    parser.add_argument("--no-incremental", action="store_true", help="ignore the manifest and recompute every stage")
+    parser.add_argument("--manifest", type=Path, help="incremental cache file (default: one per set of inputs under data/manifests)")
+    parser.add_argument("--index", choices=list(INDEX_MODES), default="auto",
+                        help=f"rank from an ANN index shortlist instead of scoring every resume "
+                             f"(auto: pools of {INDEX_MIN_RESUMES}+ resumes; needs --top-k > 0 and incremental mode)")
+    parser.add_argument("--stream", action="store_true",
+                        help="write every result to the .jsonl output as it is scored and keep only the top K in memory "
+                             "(for very large pools; no manifest)")
+    parser.add_argument("--ranked", action="store_true",
+                        help="with --stream, write the .jsonl output in rank order (sorted on disk, row = rank - 1)")
+    parser.add_argument("--timings", action="store_true", help="print per-stage timings")
+    parser.add_argument("--metrics-log", help="append the run's metrics as one JSON line to this file")
+    args = parser.parse_args(argv)
+
+    jd_file = Path(args.jd)
+    if not jd_file.exists():
+        print(f"❌ Job description not found: {jd_file}")
+        return 1
+    jd_text = jd_file.read_text(encoding="utf-8").strip()
+    analyst_agent.use_backend(args.backend)
+
+    if args.ranked and not args.stream:
+        print("❌ --ranked only applies to --stream output")
+        return 1
+
+    metrics = PipelineMetrics()
+    if args.stream:
+        if (args.format or Path(args.output).suffix.lower().lstrip(".")) != "jsonl":
+            print("❌ --stream writes a JSON Lines store; use a .jsonl output or --format jsonl")
+            return 1
+        top = stream(args.resumes, jd_text, args.output, top_k=args.top_k, workers=args.workers,
+                     batch_size=args.batch_size, ranked=args.ranked, metrics=metrics, metrics_log=args.metrics_log)
+        if args.timings:
+            print_metrics(metrics.as_dict())
+        for record in top:
+            print(f"🏆 {record['rank']}. {record['candidate']} ({record['file_name']}): {record['recommendation_score']}")
+        return 0 if top else 1
+
+    ranked = screen(args.resumes, jd_text, top_k=args.top_k, workers=args.workers,
+                    batch_size=args.batch_size, incremental=not args.no_incremental,
+                    metrics=metrics, metrics_log=args.metrics_log, manifest_file=args.manifest,
+                    use_index=INDEX_MODES[args.index])
+    if args.timings:
+        print_metrics(metrics.as_dict())
+    if not ranked:
+        return 1
+    write_results(ranked, args.output, args.format)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
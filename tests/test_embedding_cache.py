@@ -0,0 +1,61 @@
+import multiprocessing
+
+import numpy as np
+
+from utils.embedding_cache import EmbeddingCache
+
+def vector(seed, dim=4):
+    return np.random.default_rng(seed).random(dim, dtype=np.float32)
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = EmbeddingCache("model", cache_dir=tmp_path, max_entries=3)
+    cache.put_many(["a", "b", "c"], [vector(0), vector(1), vector(2)])
+    cache.flush()
+    cache.get_many(["a"])  # "b" is now the least recently used
+    cache.flush()
+    cache.put_many(["d"], [vector(3)])
+    cache.flush()
+
+    reopened = EmbeddingCache("model", cache_dir=tmp_path, max_entries=3)
+    a, b, c, d = reopened.get_many(["a", "b", "c", "d"])
+    assert b is None
+    assert len(reopened) == 3
+    for found, seed in ((a, 0), (c, 2), (d, 3)):
+        np.testing.assert_array_equal(found, vector(seed))
+
+def test_writers_merge_instead_of_overwriting(tmp_path):
+    first = EmbeddingCache("model", cache_dir=tmp_path)
+    second = EmbeddingCache("model", cache_dir=tmp_path)
+    first.put_many(["a"], [vector(0)])
+    first.flush()
+    second.put_many(["b"], [vector(1)])
+    second.flush()
+
+    # The second writer reloaded the first one's index before writing, and the first sees its rows
+    a, b = first.get_many(["a", "b"])
+    np.testing.assert_array_equal(a, vector(0))
+    np.testing.assert_array_equal(b, vector(1))
+
+# ✍️ One writer process; top-level so spawned processes can import it
+def write_entries(cache_dir, writer):
+    cache = EmbeddingCache("model", cache_dir=cache_dir)
+    for start in range(0, 40, 5):
+        texts = [f"{writer}-{i}" for i in range(start, start + 5)]
+        cache.put_many(texts, [vector(writer * 1000 + i) for i in range(start, start + 5)])
+        cache.flush()
+
+def test_concurrent_writer_processes_keep_every_entry(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=write_entries, args=(tmp_path, writer)) for writer in (1, 2)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+        assert process.exitcode == 0
+
+    cache = EmbeddingCache("model", cache_dir=tmp_path)
+    assert len(cache) == 80
+    for writer in (1, 2):
+        found = cache.get_many([f"{writer}-{i}" for i in range(40)])
+        for i, embed in enumerate(found):
+            np.testing.assert_array_equal(embed, vector(writer * 1000 + i))
@@ -0,0 +1,29 @@
+import time
+
+from utils.job_queue import DONE, FAILED, JobQueue
+
+def fail_on_request(params, report):
+    report("parse", 1, 1)
+    if params.get("fail"):
+        raise RuntimeError("boom")
+    return {"echo": params["value"]}
+
+def test_finished_jobs_are_purged_when_the_queue_starts(tmp_path):
+    db_file = tmp_path / "jobs.sqlite3"
+    queue = JobQueue(fail_on_request, db_file=db_file).start()
+    done = queue.submit({"value": 1})
+    failed = queue.submit({"value": 2, "fail": True})
+    assert queue.wait(done, timeout=10)["status"] == DONE
+    assert queue.wait(failed, timeout=10)["status"] == FAILED
+    queue.stop()
+    queued = JobQueue(fail_on_request, db_file=db_file).submit({"value": 3})
+
+    # Still inside the retention window: nothing goes
+    reopened = JobQueue(fail_on_request, db_file=db_file)
+    assert reopened.get(done)["result"] == {"echo": 1}
+
+    time.sleep(0.1)
+    reopened = JobQueue(fail_on_request, db_file=db_file, keep_finished=0.05)
+    assert reopened.get(done) is None
+    assert reopened.get(failed) is None
+    assert reopened.get(queued)["status"] == "queued"
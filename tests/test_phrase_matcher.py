@@ -0,0 +1,51 @@
+import random
+
+from agents.hr_agent import RED_FLAGS, SOFT_SKILLS
+from utils.phrase_matcher import PhraseMatcher
+
+# 🔀 The same phrases matched by the regex path and by the automaton path
+def both_paths(phrases):
+    regex = PhraseMatcher({phrase: phrase for phrase in phrases}).build()
+    regex.pattern = regex.build_pattern()
+    automaton = PhraseMatcher({phrase: phrase for phrase in phrases}).build()
+    automaton.pattern = None
+    return regex, automaton
+
+def random_text(rng, words, separators, count):
+    text = ""
+    for _ in range(rng.randint(0, count)):
+        word = rng.choice(words)
+        text += rng.choice([word, word.upper(), word.title()]) + rng.choice(separators)
+    return text
+
+def test_regex_path_finds_what_the_automaton_finds():
+    phrases = sorted(SOFT_SKILLS | RED_FLAGS) + ["c++", "c#", "node.js", "js", "machine learning", "machine",
+                                                 "learning systems", "java"]
+    words = ["c++", "c", "c#", "node.js", "node", "js", "java", "machine", "learning", "systems", "gap", "singapore",
+             "team", "teamwork", "problem", "solving", "no", "experience", "job", "hopping", "résumé", "straße", "3.5"]
+    separators = [" ", "  ", "\n", "-", ".", ", ", "/", "", "é"]
+    regex, automaton = both_paths(phrases)
+    rng = random.Random(14)
+    for _ in range(3000):
+        text = random_text(rng, words, separators, 15)
+        assert regex.find_all(text) == automaton.find_all(text), text
+
+def test_both_paths_match_baseline_substring_semantics():
+    phrases = sorted(SOFT_SKILLS | RED_FLAGS)
+    # Whole words only: substring search agrees with word matching when no word contains a phrase
+    words = sorted({word for phrase in phrases for word in phrase.split()}) + ["python", "engineer", "years", "the"]
+    regex, automaton = both_paths(phrases)
+    rng = random.Random(16)
+    for _ in range(3000):
+        text = random_text(rng, words, [" ", "\n", "\t ", "  "], 20)
+        clean_text = " ".join(text.split()).lower()
+        baseline = sorted(phrase for phrase in phrases if phrase in clean_text)
+        assert sorted(set(regex.find_all(text))) == baseline, text
+        assert sorted(set(automaton.find_all(text))) == baseline, text
+
+def test_small_sets_use_the_regex_and_large_sets_the_automaton():
+    small = PhraseMatcher({phrase: phrase for phrase in SOFT_SKILLS}).build()
+    large = PhraseMatcher({f"skill {i}": i for i in range(100)}).build()
+    assert small.pattern is not None
+    assert large.pattern is None
+    assert large.find_unique("Skill 7, skill 42 and skill 7 again") == [7, 42]
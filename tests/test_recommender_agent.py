@@ -0,0 +1,47 @@
+import json
+import random
+
+from agents.recommender_agent import TopKRanker, rank_key, top_k_resumes
+from utils.result_store import ResultStore
+
+# 🎲 Scored resumes with many tied scores, tied file names and some without a file name
+def make_resumes(count, seed=7):
+    rng = random.Random(seed)
+    resumes = []
+    for i in range(count):
+        resume = {"recommendation_score": rng.choice([40.0, 55.5, 55.5, 61.25, 80.0]), "row": i}
+        if i % 9:
+            resume["file_name"] = f"resume_{rng.randrange(count // 4)}.pdf"
+        resumes.append(resume)
+    return resumes
+
+def test_spilled_ranking_matches_in_memory_ranking(tmp_path):
+    resumes = make_resumes(500)
+    with TopKRanker(10, spill_dir=tmp_path / "spill", chunk_size=37) as ranker:
+        ranked = list(ranker.extend(resumes).iter_ranked())
+        top = ranker.top()
+        assert len(list((tmp_path / "spill").iterdir())) == 14
+
+    assert not list((tmp_path / "spill").iterdir())
+    assert [r["row"] for r in ranked] == [r["row"] for r in sorted(resumes, key=rank_key)]
+    assert [r["row"] for r in ranked[:10]] == [r["row"] for r in top_k_resumes(resumes, 10)]
+    assert [r["row"] for r in top] == [r["row"] for r in top_k_resumes(resumes, 10)]
+
+def test_ties_keep_arrival_order_across_chunks(tmp_path):
+    resumes = [{"recommendation_score": 50.0, "file_name": "same.pdf", "row": i} for i in range(25)]
+    with TopKRanker(5, spill_dir=tmp_path, chunk_size=4) as ranker:
+        ranked = list(ranker.extend(resumes).iter_ranked())
+
+    assert [r["row"] for r in ranked] == list(range(25))
+    assert [r["row"] for r in top_k_resumes(resumes, 5)] == list(range(5))
+
+def test_write_ranked_store_rows_are_ranks(tmp_path):
+    resumes = make_resumes(200, seed=3)
+    with TopKRanker(0, spill_dir=True, chunk_size=16) as ranker:
+        count = ranker.extend(resumes).write_ranked(tmp_path / "ranked.jsonl")
+
+    store = ResultStore(tmp_path / "ranked.jsonl")
+    expected = [r["row"] for r in sorted(resumes, key=rank_key)]
+    assert count == len(store) == 200
+    assert [json.loads(line)["row"] for line in open(tmp_path / "ranked.jsonl")] == expected
+    assert store[0]["row"] == expected[0] and store[-1]["row"] == expected[-1]
@@ -0,0 +1,31 @@
+from utils.result_store import ResultStore
+
+def records(start, stop):
+    return [{"file_name": f"resume_{i}.pdf", "recommendation_score": float(i)} for i in range(start, stop)]
+
+def test_torn_last_line_is_ignored_and_dropped_on_append(tmp_path):
+    store = ResultStore(tmp_path / "results.jsonl")
+    store.write(records(0, 3))
+    with open(store.path, "ab") as f:
+        f.write(b'{"file_name": "resume_3.pdf", "recomm')  # a run killed mid-write
+
+    reopened = ResultStore(store.path)
+    assert len(reopened) == 3
+    assert list(reopened) == records(0, 3)
+
+    assert reopened.append(records(3, 5)) == 2
+    assert list(ResultStore(store.path)) == records(0, 5)
+    assert ResultStore(store.path)[-1] == records(4, 5)[0]
+
+def test_lagging_or_missing_index_is_rebuilt_from_the_data(tmp_path):
+    store = ResultStore(tmp_path / "results.jsonl")
+    store.write(records(0, 10))
+
+    # Data is flushed before offsets, so a crash can leave the index short
+    offsets = store.index_file.read_bytes()
+    store.index_file.write_bytes(offsets[:4 * 8])
+    assert len(ResultStore(store.path)) == 10
+    assert ResultStore(store.path).page(6, 10) == records(6, 10)
+
+    store.index_file.unlink()
+    assert ResultStore(store.path)[7] == records(7, 8)[0]
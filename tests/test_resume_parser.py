@@ -0,0 +1,50 @@
+import os
+import time
+
+from utils.resume_parser import extract_files_parallel
+
+# 🐌 Stand-in extractors; top-level so worker processes can import them
+def slow_extract(file):
+    if file.name.startswith("slow"):
+        time.sleep(60)
+    if file.name.startswith("crash"):
+        os._exit(1)
+    return file.name, None, 0.0
+
+def run(files, **options):
+    start = time.monotonic()
+    out = list(extract_files_parallel(files, extract=slow_extract, **options))
+    return out, time.monotonic() - start
+
+def test_slow_file_times_out_without_holding_up_the_others(tmp_path):
+    files = [tmp_path / f"resume_{i}.pdf" for i in range(8)]
+    files.insert(2, tmp_path / "slow.pdf")
+    out, seconds = run(files, workers=2, timeout=2)
+
+    assert seconds < 30
+    assert [file for file, _, _ in out] == files
+    errors = {file.name: error for file, _, error in out}
+    assert errors.pop("slow.pdf").startswith("timed out")
+    assert set(errors.values()) == {None}
+    assert [text for file, text, _ in out if file.name != "slow.pdf"] == [f.name for f in files if f.name != "slow.pdf"]
+
+def test_every_slow_file_costs_one_timeout_not_a_pool_restart(tmp_path):
+    files = [tmp_path / f"slow_{i}.pdf" for i in range(4)] + [tmp_path / "resume.pdf"]
+    out, seconds = run(files, workers=4, timeout=2)
+
+    # Four stuck files run side by side, so the batch takes about one timeout
+    assert seconds < 20
+    assert [error is not None for _, _, error in out] == [True, True, True, True, False]
+
+def test_crashed_worker_is_replaced(tmp_path):
+    files = [tmp_path / "resume_0.pdf", tmp_path / "crash.pdf", tmp_path / "resume_1.pdf"]
+    out, _ = run(files, workers=2, timeout=30)
+
+    assert [file for file, _, _ in out] == files
+    assert out[1][2] == "extraction worker exited unexpectedly"
+    assert [out[0][1], out[2][1]] == ["resume_0.pdf", "resume_1.pdf"]
+
+def test_single_worker_runs_in_process(tmp_path):
+    files = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+    out, _ = run(files, workers=1)
+    assert [(file, text, error) for file, text, error in out] == [(files[0], "a.pdf", None), (files[1], "b.pdf", None)]
@@ -0,0 +1,59 @@
+import numpy as np
+
+from utils.vector_index import MIN_TRAIN_SIZE, IVFIndex
+
+def unit(vectors):
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+# 🎲 Embedding-like data: unit vectors scattered around a few dozen topics, plus queries from the same topics
+def clustered(count, queries, dim=384, topics=40, noise=0.15, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = unit(rng.standard_normal((topics, dim)))
+    vectors = unit(centers[rng.integers(0, topics, count)] + noise * rng.standard_normal((count, dim)))
+    probes = unit(centers[rng.integers(0, topics, queries)] + noise * rng.standard_normal((queries, dim)))
+    return vectors, probes
+
+def ids(count, prefix="id"):
+    return [f"{prefix}{i}" for i in range(count)]
+
+def test_add_remove_save_load_round_trip(tmp_path):
+    vectors, queries = clustered(2 * MIN_TRAIN_SIZE, 20)
+    index = IVFIndex(vectors.shape[1], index_dir=tmp_path)
+    index.add(ids(len(vectors)), vectors)
+    assert index.centroids is not None
+
+    removed = ids(len(vectors))[::7]
+    index.remove(removed)
+    replaced, = np.random.default_rng(1).standard_normal((1, vectors.shape[1]))
+    index.add(["id1"], unit(replaced[None]))
+    index.save()
+
+    loaded = IVFIndex(vectors.shape[1], index_dir=tmp_path)
+    assert sorted(loaded.ids()) == sorted(index.ids())
+    assert not any(item_id in loaded for item_id in removed)
+    np.testing.assert_array_equal(loaded.vectors[loaded.id_to_slot["id1"]], unit(replaced[None])[0])
+    for query in queries:
+        assert loaded.search(query, 10) == index.search(query, 10)
+
+def test_index_for_another_dimension_is_not_loaded(tmp_path):
+    index = IVFIndex(8, index_dir=tmp_path)
+    index.add(ids(3), unit(np.ones((3, 8))))
+    index.save()
+    assert len(IVFIndex(16, index_dir=tmp_path)) == 0
+
+def test_recall_at_10_stays_above_floor(tmp_path):
+    vectors, queries = clustered(4000, 200)
+    index = IVFIndex(vectors.shape[1], index_dir=tmp_path)
+    index.add(ids(len(vectors)), vectors)
+
+    recalls = []
+    for query in queries:
+        exact = {f"id{i}" for i in np.argsort(-(vectors @ query))[:10]}
+        found = {item_id for item_id, _ in index.search(query, 10)}
+        recalls.append(len(exact & found) / 10)
+    assert np.mean(recalls) >= 0.8
+
+    # Probing every list is an exact scan
+    query = queries[0]
+    exact = [f"id{i}" for i in np.argsort(-(vectors @ query))[:10]]
+    assert [item_id for item_id, _ in index.search(query, 10, n_probe=len(index.centroids))] == exact
@@ -0,0 +1,77 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+# ⚙️ Upload bytes kept in memory across all sessions; the least recently used sessions are dropped first
+MAX_STORE_BYTES = 512 * 1024 * 1024
+
+# 📎 An uploaded file held in memory; quacks like a Path where the pipeline needs it (name, suffix)
+class InMemoryFile:
+    def __init__(self, name: str, data: bytes):
+        self.name = Path(name).name
+        self.data = data
+        self._sha256 = None
+
+    @property
+    def suffix(self):
+        return Path(self.name).suffix
+
+    @property
+    def size(self):
+        return len(self.data)
+
+    # 🔑 Content hash, computed once per upload
+    @property
+    def sha256(self):
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.data).hexdigest()
+        return self._sha256
+
+    def __repr__(self):
+        return f"InMemoryFile({self.name!r}, {self.size} bytes)"
+
+# 🗃️ Process-wide store of uploads per key (one key per screening session)
+#    Screening jobs and download buttons read the same buffers, so uploads never touch the disk.
+class BufferStore:
+    def __init__(self, max_bytes: int = MAX_STORE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> {name: InMemoryFile}
+        self._lock = threading.Lock()
+
+    # 💾 Replace a key's files (name -> bytes); unchanged uploads keep their cached hash
+    def put(self, key: str, uploads: dict):
+        with self._lock:
+            previous = self._entries.pop(key, {})
+            files = {}
+            for name, data in uploads.items():
+                old = previous.get(Path(name).name)
+                files[Path(name).name] = old if old is not None and old.data == data else InMemoryFile(name, data)
+            self._entries[key] = files
+            self._evict()
+
+    def _evict(self):
+        total = sum(f.size for files in self._entries.values() for f in files.values())
+        while total > self.max_bytes and len(self._entries) > 1:
+            _, files = self._entries.popitem(last=False)
+            total -= sum(f.size for f in files.values())
+
+    # 📂 A key's files in name order, or None when unknown (e.g. after a restart)
+    def get(self, key: str):
+        with self._lock:
+            files = self._entries.get(key)
+            if files is None:
+                return None
+            self._entries.move_to_end(key)
+            return [files[name] for name in sorted(files)]
+
+    def get_file(self, key: str, name: str):
+        with self._lock:
+            return self._entries.get(key, {}).get(name)
+
+    def drop(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+# 🌍 Shared by the app and the in-process job workers
+upload_store = BufferStore()
@@ -0,0 +1,177 @@
+import sys
+
+# ⚙️ Characters of the original text exposed as the "raw" preview
+RAW_CHARS = 2000
+
+# 🗂️ Fields every stage can set, in serialization order
+FIELDS = (
+    "file_name", "names_orgs", "locations", "dates", "skills",
+    "email", "phone", "recruiter_score", "recruiter_feedback",
+    "soft_skills", "red_flags", "hr_score", "hr_feedback",
+    "analyst_score", "match_score", "analyst_feedback",
+    "recommendation_score", "recommendation_feedback",
+    "rank", "candidate",
+)
+
+# 🏷️ Values drawn from small fixed vocabularies: interned so every record shares one string object
+LABEL_FIELDS = {"recruiter_feedback", "hr_feedback", "analyst_feedback", "recommendation_feedback"}
+LABEL_LIST_FIELDS = {"skills", "soft_skills", "red_flags"}
+
+# 🧾 Keys derived from the text buffer instead of stored
+DERIVED_FIELDS = {"raw", "clean_text", "full_text"}
+
+def _compact(field, value):
+    if field in LABEL_FIELDS and isinstance(value, str):
+        return sys.intern(value)
+    if field in LABEL_LIST_FIELDS and isinstance(value, (list, tuple)):
+        return tuple(sys.intern(item) for item in value)
+    return value
+
+# 🧍 One candidate as it moves through the pipeline.
+#    The resume text is stored once; "raw" (preview) and "clean_text" (whitespace-collapsed) are
+#    views of it: "raw" is sliced on access, "clean_text" is built on first access and kept.
+#    Setting either to anything but the derived value raises ValueError.
+#    Supports the dict-style access the agents use (get / [] / update / pop / copy), so agents run
+#    unchanged on dicts and records.
+#    Serialized like the dicts it replaces: "full_text" until the recruiter marks it cleaned, then "clean_text".
+class CandidateRecord:
+    __slots__ = ("text", "cleaned", "_clean", "_extra") + FIELDS
+
+    def __init__(self, text="", cleaned=False, **fields):
+        self.text = text
+        self.cleaned = cleaned
+        self._clean = None
+        self._extra = None
+        self.update(fields)
+
+    # 📖 Derived views of the single text buffer
+    @property
+    def raw(self):
+        return self.text[:RAW_CHARS]
+
+    @property
+    def clean_text(self):
+        if self._clean is None:
+            self._clean = " ".join(self.text.split())
+        return self._clean
+
+    def __getitem__(self, key):
+        if key in DERIVED_FIELDS:
+            return self.text if key == "full_text" else getattr(self, key)
+        if key in FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key == "full_text":
+            self.text, self._clean = value, None
+        elif key in ("clean_text", "raw"):
+            if value != getattr(self, key):
+                raise ValueError(f"{key} is derived from the record's text and cannot be set to a different value")
+            if key == "clean_text":
+                self.cleaned = True
+        elif key in FIELDS:
+            setattr(self, key, _compact(key, value))
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key):
+        try:
+            self[key]
+            return True
+        except KeyError:
+            return False
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def update(self, fields=(), **more):
+        for key, value in dict(fields, **more).items():
+            self[key] = value
+
+    # ➖ Removes a stored field; derived keys and the text buffer are never removed
+    def pop(self, key, *default):
+        if key in DERIVED_FIELDS:
+            return self[key]
+        try:
+            value = self[key]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        if key in FIELDS:
+            delattr(self, key)
+        else:
+            del self._extra[key]
+        return value
+
+    def keys(self):
+        keys = [field for field in FIELDS if hasattr(self, field)]
+        return keys + ["raw", "clean_text" if self.cleaned else "full_text"] + list(self._extra or ())
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    # 📄 Shallow copy: shares the text buffer and the interned labels
+    def copy(self):
+        clone = CandidateRecord.__new__(CandidateRecord)
+        for slot in self.__slots__:
+            if hasattr(self, slot):
+                setattr(clone, slot, getattr(self, slot))
+        clone._extra = dict(self._extra) if self._extra else None
+        return clone
+
+    # 💾 JSON-ready dict. storage=True keeps the text once (for caches); otherwise the
+    #    familiar output shape with "raw" and "clean_text" is produced.
+    def to_dict(self, storage=False):
+        out = {}
+        for field in FIELDS:
+            if hasattr(self, field):
+                value = getattr(self, field)
+                out[field] = list(value) if field in LABEL_LIST_FIELDS else value
+        if storage:
+            out["text"] = self.text
+        else:
+            out["raw"] = self.raw
+            if self.cleaned:
+                out["clean_text"] = self.clean_text
+            else:
+                out["full_text"] = self.text
+        if self._extra:
+            out.update(self._extra)
+        return out
+
+    # 📥 From parser output (full_text) or a stored record (text, always past the recruiter)
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        cleaned = "text" in data or "clean_text" in data
+        text = data.pop("text", None)
+        if text is None:
+            text = data.get("full_text") or data.get("clean_text") or data.get("raw") or ""
+        for key in DERIVED_FIELDS:
+            data.pop(key, None)
+        return cls(text, cleaned=cleaned, **data)
+
+    def __repr__(self):
+        return f"CandidateRecord({getattr(self, 'file_name', None)!r}, {len(self.text)} chars)"
+
+# 🔁 Plain dict for JSON output, whatever the record type
+def to_plain(record):
+    return record.to_dict() if isinstance(record, CandidateRecord) else record
@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+# 📁 Path setup
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ONNX_DIR = PROJECT_ROOT / "data" / "onnx"
+
+# 🧠 float32 PyTorch, the reference every other backend is checked against
+def load_torch(model_name, device=None):
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name, device=device)
+
+# 🗜️ PyTorch with every Linear layer dynamically quantized to int8 (weights int8, activations quantized per batch)
+def load_torch_int8(model_name):
+    import torch
+    model = load_torch(model_name, device="cpu")  # quantized kernels are CPU only
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+def onnx_dir(model_name):
+    return ONNX_DIR / model_name.replace("/", "__")
+
+# 📤 Export the transformer to ONNX once, with its tokenizer and pooling settings
+#    Needs torch and sentence-transformers; later loads only need onnxruntime and the tokenizer.
+def export_onnx(model_name, export_dir):
+    import torch
+    from sentence_transformers.models import Pooling
+
+    model = load_torch(model_name, device="cpu")
+    transformer, pooling = model[0], model[1]
+    if not isinstance(pooling, Pooling) or not pooling.pooling_mode_mean_tokens:
+        raise ValueError(f"{model_name} does not use mean pooling; only mean-pooled models can be exported")
+
+    export_dir = Path(export_dir)
+    export_dir.mkdir(parents=True, exist_ok=True)
+    transformer.tokenizer.save_pretrained(export_dir)
+    sample = transformer.tokenizer(["warm up"], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "tokens"} for name in input_names + ["last_hidden_state"]}
+    torch.onnx.export(
+        transformer.auto_model, tuple(sample[name] for name in input_names), str(export_dir / "model.onnx"),
+        input_names=input_names, output_names=["last_hidden_state"], dynamic_axes=dynamic_axes, opset_version=14,
+    )
+    with open(export_dir / "export.json", "w", encoding="utf-8") as f:
+        json.dump({
+            "model": model_name,
+            "max_seq_length": model.max_seq_length,
+            "dim": model.get_sentence_embedding_dimension(),
+        }, f, indent=2)
+
+# 🗜️ int8 copy of an exported graph (onnxruntime dynamic quantization)
+def quantize_onnx(model_file, quantized_file):
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    quantize_dynamic(str(model_file), str(quantized_file), weight_type=QuantType.QInt8)
+
+# ⚡ Exported graph run with onnxruntime; encode() matches SentenceTransformer.encode for mean-pooled models
+class OnnxEncoder:
+    def __init__(self, export_dir, model_file):
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ImportError("The onnx analyst backends need onnxruntime: pip install onnxruntime") from e
+        from transformers import AutoTokenizer
+
+        with open(Path(export_dir) / "export.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        self.max_seq_length = meta["max_seq_length"]
+        self.dim = meta["dim"]
+        self.tokenizer = AutoTokenizer.from_pretrained(export_dir)
+        self.session = onnxruntime.InferenceSession(str(model_file), providers=["CPUExecutionProvider"])
+        self.input_names = [model_input.name for model_input in self.session.get_inputs()]
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim
+
+    def encode(self, texts, batch_size=32, normalize_embeddings=False, **_):
+        texts = [str(text).strip() for text in texts]
+        embeds = np.zeros((len(texts), self.dim), dtype=np.float32)
+        # Longest first, so texts of similar length share a batch and padding stays small
+        order = np.argsort([-len(text) for text in texts], kind="stable")
+        for start in range(0, len(texts), batch_size):
+            rows = order[start:start + batch_size]
+            tokens = self.tokenizer([texts[row] for row in rows], padding=True, truncation=True,
+                                    max_length=self.max_seq_length, return_tensors="np")
+            hidden = self.session.run(None, {name: tokens[name].astype(np.int64) for name in self.input_names})[0]
+            mask = tokens["attention_mask"][..., np.newaxis].astype(np.float32)
+            embeds[rows] = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeds, axis=1, keepdims=True)
+            embeds /= np.where(norms == 0, 1, norms)
+        return embeds
+
+def load_onnx(model_name, quantized=False):
+    export_dir = onnx_dir(model_name)
+    model_file = export_dir / "model.onnx"
+    if not (export_dir / "export.json").exists():  # written last, so an interrupted export is redone
+        print(f"📤 Exporting {model_name} to ONNX in {export_dir}...")
+        export_onnx(model_name, export_dir)
+    if quantized:
+        quantized_file = export_dir / "model_int8.onnx"
+        if not quantized_file.exists():
+            quantize_onnx(model_file, quantized_file)
+        model_file = quantized_file
+    return OnnxEncoder(export_dir, model_file)
+
+# 🗂️ Inference backends by name; each loader returns an object with SentenceTransformer's
+#    encode() and get_sentence_embedding_dimension()
+BACKENDS = {
+    "torch": load_torch,
+    "torch-int8": load_torch_int8,
+    "onnx": load_onnx,
+    "onnx-int8": lambda model_name: load_onnx(model_name, quantized=True),
+}
+
+def load_backend(name, model_name):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown analyst backend {name!r}; choose from {', '.join(BACKENDS)}")
+    return BACKENDS[name](model_name)
@@ -0,0 +1,145 @@
+import json
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from utils.file_lock import file_lock
+
+# 📁 Path setup
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+CACHE_DIR = PROJECT_ROOT / "data" / "embedding_cache"
+
+# ⚙️ Maximum number of embeddings kept on disk per model
+MAX_ENTRIES = 50_000
+
+# 🔑 Content-addressed key: same text + same model -> same embedding
+def embedding_key(text: str, model_name: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+# 🗄️ Memory-mapped float32 matrix + JSON index with LRU eviction, safe to share between processes
+#    New embeddings and LRU touches are buffered in memory; flush() takes an exclusive file lock,
+#    reloads the index other processes may have written, then assigns slots and writes rows and index.
+#    Lookups hold a shared lock and reload the index whenever another process has replaced it.
+class EmbeddingCache:
+    def __init__(self, model_name: str, dim: int = None, cache_dir: Path = CACHE_DIR, max_entries: int = MAX_ENTRIES):
+        self.model_name = model_name
+        self.dim = dim
+        self.max_entries = max_entries
+        self.folder = Path(cache_dir) / model_name.replace("/", "__")
+        self.index_file = self.folder / "index.json"
+        self.matrix_file = self.folder / "embeddings.npy"
+        self.lock_file = self.folder / "cache.lock"
+        self._pending = OrderedDict()  # key -> embedding not written yet
+        self._touched = OrderedDict()  # keys looked up since the last flush, most recent last
+        self._lock = threading.Lock()
+        self.folder.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.lock_file, shared=True):
+            self._load()
+
+    # 🪪 Identity of the index file on disk; changes whenever any process rewrites it
+    def _index_stamp(self):
+        try:
+            stat = self.index_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    # 📥 Open the matrix and index as they are on disk; with dim=None the saved dim is used
+    def _load(self):
+        self.index = OrderedDict()
+        self.matrix = None
+        self._stamp = self._index_stamp()
+        if not (self.matrix_file.exists() and self._stamp is not None):
+            return
+        try:
+            matrix = np.load(self.matrix_file, mmap_mode="r+")
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if self.dim is None:
+                self.dim = meta.get("dim")
+            if matrix.shape == (self.max_entries, self.dim) and meta.get("dim") == self.dim:
+                self.matrix = matrix
+                self.index = OrderedDict((key, slot) for key, slot in meta["entries"])
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ Embedding cache unreadable, rebuilding: {e}")
+            self.index, self.matrix = OrderedDict(), None
+
+    # 🆕 Fresh, empty matrix on disk (only called under the exclusive lock)
+    def _create_matrix(self):
+        self.index = OrderedDict()
+        self.matrix = np.lib.format.open_memmap(
+            self.matrix_file, mode="w+", dtype=np.float32, shape=(self.max_entries, self.dim)
+        )
+
+    # 🔍 Look up texts; returns a list with an embedding or None per text
+    def get_many(self, texts):
+        found = []
+        with self._lock, file_lock(self.lock_file, shared=True):
+            if self._index_stamp() != self._stamp:
+                self._load()
+            for text in texts:
+                key = embedding_key(text, self.model_name)
+                pending = self._pending.get(key)
+                slot = self.index.get(key) if self.matrix is not None else None
+                if pending is None and slot is None:
+                    found.append(None)
+                    continue
+                self._touched[key] = None
+                self._touched.move_to_end(key)
+                found.append(np.array(pending if pending is not None else self.matrix[slot]))
+        return found
+
+    # 💾 Queue embeddings for the next flush
+    def put_many(self, texts, embeds):
+        with self._lock:
+            for text, embed in zip(texts, embeds):
+                if self.dim is None:
+                    self.dim = len(embed)
+                key = embedding_key(text, self.model_name)
+                self._pending[key] = np.asarray(embed, dtype=np.float32)
+                self._pending.move_to_end(key)
+
+    # 🧾 Merge with the index on disk, evict least recently used rows when full, write rows and index
+    def flush(self):
+        with self._lock:
+            if not self._pending and not self._touched:
+                return
+            with file_lock(self.lock_file):
+                if self._index_stamp() != self._stamp:
+                    self._load()
+                if self.matrix is None:
+                    if self.dim is None:
+                        return
+                    self._create_matrix()
+                for key in self._touched:
+                    if key in self.index:
+                        self.index.move_to_end(key)
+                used = set(self.index.values())
+                free_slots = [slot for slot in range(self.max_entries - 1, -1, -1) if slot not in used]
+                for key, embed in self._pending.items():
+                    slot = self.index.get(key)
+                    if slot is None:
+                        slot = free_slots.pop() if free_slots else self.index.popitem(last=False)[1]
+                    self.index[key] = slot
+                    self.index.move_to_end(key)
+                    self.matrix[slot] = embed
+                self.matrix.flush()
+                meta = {"model": self.model_name, "dim": self.dim, "entries": list(self.index.items())}
+                tmp_file = self.index_file.with_suffix(".tmp")
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(meta, f)
+                os.replace(tmp_file, self.index_file)
+                self._stamp = self._index_stamp()
+            self._pending.clear()
+            self._touched.clear()
+
+    def __len__(self):
+        return len(self.index)
@@ -0,0 +1,167 @@
+import json
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+# 📁 Path setup
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+JOBS_DB = PROJECT_ROOT / "data" / "jobs.sqlite3"
+
+# ⚙️ Queue settings
+JOB_WORKERS = 2
+POLL_INTERVAL = 0.5  # seconds an idle worker waits before checking the queue again
+STALE_AFTER = 60 * 60  # running jobs without progress for this long are assumed dead and re-queued
+KEEP_FINISHED = 7 * 24 * 60 * 60  # finished jobs (and their results) are deleted this long after they end
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    progress TEXT NOT NULL DEFAULT '{}',
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+# 📬 SQLite-backed job queue; a pool of worker threads runs `handler(params, report)` per job
+#    report(stage, done, total) records per-stage progress that pollers can read back
+class JobQueue:
+    def __init__(self, handler, db_file: Path = JOBS_DB, workers: int = JOB_WORKERS,
+                 keep_finished: float = KEEP_FINISHED):
+        self.handler = handler
+        self.db_file = Path(db_file)
+        self.workers = workers
+        self._threads = []
+        self._stop = threading.Event()
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(SCHEMA)
+            # Jobs left running by a crashed process go back on the queue
+            conn.execute(
+                "UPDATE jobs SET status = ? WHERE status = ? AND updated_at < ?",
+                (QUEUED, RUNNING, time.time() - STALE_AFTER),
+            )
+        self.purge_finished(keep_finished)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    # ▶️ Start the worker threads (idempotent)
+    def start(self):
+        if self._threads:
+            return self
+        for number in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"job-worker-{number}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._stop.clear()
+
+    # ➕ Queue a job and return its id
+    def submit(self, params: dict) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, status, params, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, QUEUED, json.dumps(params), now, now),
+            )
+        return job_id
+
+    # 🔍 Current state of a job, or None if unknown
+    def get(self, job_id: str):
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            "id": row["id"],
+            "status": row["status"],
+            "params": json.loads(row["params"]),
+            "progress": json.loads(row["progress"]),
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+
+    # 🧹 Delete done/failed jobs that ended more than `older_than` seconds ago; returns how many were deleted
+    def purge_finished(self, older_than: float = KEEP_FINISHED) -> int:
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (DONE, FAILED, time.time() - older_than),
+            )
+        return cursor.rowcount
+
+    # ⏳ Block until the job finishes (or the timeout passes) and return its state
+    def wait(self, job_id: str, timeout: float = None):
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job["status"] in (DONE, FAILED):
+                return job
+            if deadline is not None and time.time() >= deadline:
+                return job
+            time.sleep(POLL_INTERVAL)
+
+    # 🔒 Atomically move the oldest queued job to running
+    def _claim(self):
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT id, params FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1", (QUEUED,)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None, None
+            conn.execute("UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?", (RUNNING, time.time(), row["id"]))
+            conn.execute("COMMIT")
+        return row["id"], json.loads(row["params"])
+
+    def _update(self, job_id, **fields):
+        fields["updated_at"] = time.time()
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as conn:
+            conn.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+
+    def _work(self):
+        while not self._stop.is_set():
+            job_id, params = self._claim()
+            if job_id is None:
+                self._stop.wait(POLL_INTERVAL)
+                continue
+
+            progress = {}
+
+            def report(stage, done, total):
+                progress[stage] = {"done": done, "total": total}
+                self._update(job_id, progress=json.dumps(progress))
+
+            try:
+                result = self.handler(params, report)
+                self._update(job_id, status=DONE, result=json.dumps(result))
+            except Exception as e:
+                traceback.print_exc()
+                self._update(job_id, status=FAILED, error=f"{type(e).__name__}: {e}")
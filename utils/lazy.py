@@ -0,0 +1,38 @@
+import threading
+import time
+
+# 💤 Thread-safe singleton that builds its value on first use
+class LazyModel:
+    def __init__(self, name, factory):
+        self.name = name
+        self.factory = factory
+        self.load_seconds = None
+        self._value = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self._value is not None
+
+    def get(self):
+        if self._value is None:
+            with self._lock:
+                if self._value is None:
+                    start = time.perf_counter()
+                    self._value = self.factory()
+                    self.load_seconds = time.perf_counter() - start
+                    print(f"✅ Loaded {self.name} in {self.load_seconds:.1f}s")
+        return self._value
+
+# 🔥 Load models in a background thread so the first request does not pay for it
+def warm_up(*models):
+    def run():
+        for model in models:
+            try:
+                model.get()
+            except Exception as e:
+                print(f"⚠️ Warm-up of {model.name} failed: {e}")
+
+    thread = threading.Thread(target=run, name="model-warm-up", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,100 @@
+import json
+import hashlib
+import os
+from pathlib import Path
+
+from utils.candidate_record import CandidateRecord
+
+# 📁 Path setup
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+MANIFEST_FILE = PROJECT_ROOT / "data" / "screening_manifest.json"
+
+# ⚙️ JD-dependent scores kept per resume (oldest JDs are dropped first)
+MAX_JDS_PER_RESUME = 50
+
+# 🔑 Hash helpers
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def hash_file(file_path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# 🪪 Manifest key of a file: its full path, so equal names in different folders stay apart
+#    (in-memory uploads are unique by name within their upload key)
+def file_key(file_path) -> str:
+    if hasattr(file_path, "sha256"):
+        return file_path.name
+    return str(Path(file_path).resolve())
+
+# 📒 Content hashes plus cached per-stage outputs
+#   files:   file key (see file_key) -> {"sha256", "size", "mtime_ns"}
+#   records: content hash -> JD-independent CandidateRecord (parse + recruiter + HR)
+#   records_key: fingerprint of the keyword taxonomies the records were screened with
+#   analyst: content hash -> {JD hash -> analyst fields}
+class ScreeningManifest:
+    def __init__(self, manifest_file: Path = MANIFEST_FILE):
+        self.manifest_file = Path(manifest_file)
+        self.files, self.records, self.analyst = {}, {}, {}
+        self.records_key = None
+        if self.manifest_file.exists():
+            try:
+                with open(self.manifest_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.files = data.get("files", {})
+                # Records saved before the text was stored once have no "text" and are simply rescreened
+                self.records = {k: CandidateRecord.from_dict(v) for k, v in data.get("records", {}).items() if "text" in v}
+                self.records_key = data.get("records_key")
+                self.analyst = data.get("analyst", {})
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Manifest unreadable, starting fresh: {e}")
+
+    # 🔍 Content hash of a file, re-hashing only when size or mtime changed
+    #    In-memory uploads (utils.buffer_store.InMemoryFile) carry their own cached hash
+    def content_hash(self, file_path: Path) -> str:
+        key = file_key(file_path)
+        if hasattr(file_path, "sha256"):
+            self.files[key] = {"sha256": file_path.sha256, "size": file_path.size, "mtime_ns": None}
+            return file_path.sha256
+        stat = file_path.stat()
+        entry = self.files.get(key)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+        sha = hash_file(file_path)
+        self.files[key] = {"sha256": sha, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        return sha
+
+    def get_analyst(self, content_hash: str, jd_hash: str):
+        return self.analyst.get(content_hash, {}).get(jd_hash)
+
+    def put_analyst(self, content_hash: str, jd_hash: str, fields: dict):
+        scores = self.analyst.setdefault(content_hash, {})
+        scores.pop(jd_hash, None)
+        scores[jd_hash] = fields
+        while len(scores) > MAX_JDS_PER_RESUME:
+            scores.pop(next(iter(scores)))
+
+    # 🔑 Records screened under other taxonomies are stale; analyst scores only depend on the text and stay
+    def use_records_key(self, records_key: str):
+        if records_key != self.records_key:
+            self.records, self.records_key = {}, records_key
+
+    # 🧹 Forget files and outputs that are no longer in the pool
+    def prune(self, files, content_hashes):
+        keys, content_hashes = {file_key(f) for f in files}, set(content_hashes)
+        self.files = {k: v for k, v in self.files.items() if k in keys}
+        self.records = {k: v for k, v in self.records.items() if k in content_hashes}
+        self.analyst = {k: v for k, v in self.analyst.items() if k in content_hashes}
+
+    # 💾 Atomic write
+    def save(self):
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.manifest_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            records = {k: record.to_dict(storage=True) for k, record in self.records.items()}
+            json.dump({"files": self.files, "records": records, "records_key": self.records_key,
+                       "analyst": self.analyst}, f)
+        os.replace(tmp_file, self.manifest_file)
@@ -0,0 +1,144 @@
+import heapq
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+# 📁 Path setup
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+METRICS_LOG = PROJECT_ROOT / "data" / "pipeline_metrics.jsonl"
+
+# ⚙️ Per-document timings kept for the summary: the slowest ones, plus the first failures.
+#    Everything else only adds to the stage totals, so a run's memory does not grow with its file count.
+SLOWEST_DOCUMENTS = 25
+FAILED_DOCUMENTS = 100
+
+# ⏱️ Wall time, CPU time, throughput and failures per stage, plus the slowest and failed documents,
+#    cache hit rates and model load times for one pipeline run.
+#    CPU time is process-wide, so it also counts other threads running at the same time.
+class PipelineMetrics:
+    def __init__(self, slowest_documents=SLOWEST_DOCUMENTS, failed_documents=FAILED_DOCUMENTS):
+        self.stages = {}
+        self.slowest_documents = slowest_documents
+        self.failed_documents = failed_documents
+        self._slowest = []  # min-heap of (seconds, order, file name, stage)
+        self._failed = {}
+        self.caches = {}
+        self._models = ()
+        self._preloaded = set()
+        self._started = time.perf_counter()
+        self.wall_seconds = None
+
+    def _entry(self, name):
+        return self.stages.setdefault(name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "items": 0, "failures": 0})
+
+    # 🧭 Time a block; repeated blocks with the same name add up. Use entry["items"] += n inside.
+    @contextmanager
+    def stage(self, name, items=0):
+        entry = self._entry(name)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield entry
+        except Exception:
+            entry["failures"] += 1
+            raise
+        finally:
+            entry["wall_seconds"] += time.perf_counter() - wall
+            entry["cpu_seconds"] += time.process_time() - cpu
+            entry["items"] += items
+
+    # 🔁 Time every step of a (lazy) iterable under one stage name, one item per step
+    def iter_stage(self, name, iterable):
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name) as entry:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                entry["items"] += 1
+            yield item
+
+    # 📄 Time spent on one document in a stage that ran elsewhere (e.g. a pool worker)
+    def record_document(self, file_name, stage, seconds, error=None):
+        entry = self._entry(stage)
+        entry["items"] += 1
+        entry["wall_seconds"] += seconds
+        timing = (seconds, entry["items"], file_name, stage)
+        if len(self._slowest) < self.slowest_documents:
+            heapq.heappush(self._slowest, timing)
+        elif self._slowest and timing > self._slowest[0]:
+            heapq.heapreplace(self._slowest, timing)
+        if error:
+            entry["failures"] += 1
+            if len(self._failed) < self.failed_documents:
+                self._failed[file_name] = {f"{stage}_seconds": round(seconds, 4), "error": error}
+
+    # 📄 {file name: {"<stage>_seconds", "error"?}} for the slowest documents (slowest first) and the kept failures
+    @property
+    def documents(self):
+        documents = {}
+        for seconds, _, file_name, stage in sorted(self._slowest, reverse=True):
+            documents.setdefault(file_name, {})[f"{stage}_seconds"] = round(seconds, 4)
+        for file_name, failure in self._failed.items():
+            documents.setdefault(file_name, {}).update(failure)
+        return documents
+
+    def record_cache(self, name, hits, misses):
+        self.caches[name] = {"hits": hits, "misses": misses}
+
+    # 🗄️ Live {"hits", "misses"} counts for a cache this run looks up; callers pass it to their lookups
+    #    (e.g. analyst.embed_texts), so runs sharing a cache in one process are counted apart
+    def cache_counter(self, name):
+        return self.caches.setdefault(name, {"hits": 0, "misses": 0})
+
+    # 🧠 Lazy models/caches to report on; those already loaded are marked as not loaded by this run
+    def watch_models(self, *models):
+        self._models = models
+        self._preloaded = {model.name for model in models if model.loaded}
+
+    def finish(self):
+        self.wall_seconds = time.perf_counter() - self._started
+        return self
+
+    # 📊 JSON-ready summary
+    def as_dict(self):
+        if self.wall_seconds is None:
+            self.finish()
+
+        stages = {}
+        for name, entry in self.stages.items():
+            stages[name] = {
+                "wall_seconds": round(entry["wall_seconds"], 4),
+                "cpu_seconds": round(entry["cpu_seconds"], 4),
+                "items": entry["items"],
+                "items_per_s": round(entry["items"] / entry["wall_seconds"], 2) if entry["wall_seconds"] else None,
+                "failures": entry["failures"],
+            }
+
+        caches = {}
+        for name, counts in self.caches.items():
+            lookups = counts["hits"] + counts["misses"]
+            caches[name] = {**counts, "hit_rate": round(counts["hits"] / lookups, 3) if lookups else None}
+
+        models = {
+            model.name: {"load_seconds": round(model.load_seconds, 3), "loaded_this_run": model.name not in self._preloaded}
+            for model in self._models if model.loaded and model.load_seconds is not None
+        }
+
+        return {
+            "wall_seconds": round(self.wall_seconds, 4),
+            "stages": stages,
+            "caches": caches,
+            "models": models,
+            "documents": self.documents,
+        }
+
+    # 🧾 Append the summary as one JSON line
+    def write_log(self, log_file=METRICS_LOG, **context):
+        log_file = Path(log_file)
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        line = {"timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"), **context, **self.as_dict()}
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(line) + "\n")
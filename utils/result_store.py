@@ -0,0 +1,161 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+from utils.candidate_record import to_plain
+
+# ⚙️ Offsets buffered in memory before they are appended to the index file
+INDEX_FLUSH_ROWS = 4096
+
+# 🧾 One compact JSON line per record. ASCII output (non-ASCII is escaped) encodes faster than UTF-8;
+#    the encoder is shared because json.dumps with options builds a new one per call.
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+def encode_record(record) -> bytes:
+    return (_ENCODER.encode(to_plain(record)) + "\n").encode("ascii")
+
+# 🗃️ Results as compact JSON Lines plus an offset index, so one record or a page can be read
+#    without parsing the whole file, and later runs can append.
+#    <name>.jsonl  one record per line
+#    <name>.idx    little-endian uint64 byte offsets: row i spans offsets[i]:offsets[i + 1]
+#    Data is always flushed before the index, so after a crash the index only lags behind and
+#    is completed from the data file the next time it is opened.
+class ResultStore:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.index_file = self.path.with_suffix(".idx")
+        self._offsets = None
+        self._data_size = None
+
+    # 📏 Row offsets matching the current data file (rebuilt or completed when out of date)
+    def offsets(self):
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if self._offsets is not None and self._data_size == size:
+            return self._offsets
+        offsets = np.zeros(1, dtype="<u8")
+        if self.index_file.exists():
+            stored = np.fromfile(self.index_file, dtype="<u8")
+            if len(stored) and stored[0] == 0 and stored[-1] <= size:
+                offsets = stored
+        if offsets[-1] != size:
+            offsets = self._scan(offsets, size)
+            offsets.tofile(self.index_file)
+        self._offsets, self._data_size = offsets, size
+        return offsets
+
+    # 🔍 Offsets of the complete lines after the last indexed row (a torn last line is left out)
+    def _scan(self, offsets, size):
+        found = []
+        position = int(offsets[-1])
+        with open(self.path, "rb") as f:
+            f.seek(position)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                position += len(line)
+                found.append(position)
+        return np.concatenate([offsets, np.array(found, dtype="<u8")])
+
+    def __len__(self):
+        return len(self.offsets()) - 1
+
+    # 📄 One record by row (negative rows count from the end)
+    def __getitem__(self, row):
+        offsets = self.offsets()
+        count = len(offsets) - 1
+        if row < 0:
+            row += count
+        if not 0 <= row < count:
+            raise IndexError(f"row {row} out of range for {count} results")
+        start, end = int(offsets[row]), int(offsets[row + 1])
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            return json.loads(f.read(end - start))
+
+    # 📑 Up to `count` records from row `start`, read with one contiguous read
+    def page(self, start: int, count: int):
+        offsets = self.offsets()
+        end = min(start + count, len(offsets) - 1)
+        if start >= end:
+            return []
+        with open(self.path, "rb") as f:
+            f.seek(int(offsets[start]))
+            data = f.read(int(offsets[end] - offsets[start]))
+        return [json.loads(line) for line in data.splitlines()]
+
+    # 🌊 Every record in order
+    def __iter__(self):
+        end = int(self.offsets()[-1])
+        with open(self.path, "rb") as f:
+            while f.tell() < end:
+                yield json.loads(f.readline())
+
+    def writer(self, append: bool = False):
+        return ResultWriter(self, append=append)
+
+    # 💾 Replace the results; returns the number of records written
+    def write(self, records):
+        with self.writer() as writer:
+            writer.extend(records)
+        return writer.count
+
+    # ➕ Add records after the existing ones; returns the number of records appended
+    def append(self, records):
+        with self.writer(append=True) as writer:
+            writer.extend(records)
+        return writer.count
+
+# ✍️ Streams records into a ResultStore; use as a context manager so the index is completed
+class ResultWriter:
+    def __init__(self, store: ResultStore, append: bool = False):
+        self.store = store
+        self.count = 0
+        store.path.parent.mkdir(parents=True, exist_ok=True)
+        if append and store.path.exists():
+            offsets = store.offsets()
+            self._position = int(offsets[-1])
+            self._data = open(store.path, "r+b")
+            self._data.truncate(self._position)  # drops a torn line left by an interrupted run
+            self._data.seek(self._position)
+            self._index = open(store.index_file, "ab")
+        else:
+            self._position = 0
+            self._data = open(store.path, "wb")
+            self._index = open(store.index_file, "wb")
+            np.zeros(1, dtype="<u8").tofile(self._index)
+        self._pending = []
+        store._offsets = None
+
+    def add(self, record):
+        line = encode_record(record)
+        self._data.write(line)
+        self._position += len(line)
+        self._pending.append(self._position)
+        self.count += 1
+        if len(self._pending) >= INDEX_FLUSH_ROWS:
+            self.flush()
+
+    def extend(self, records):
+        for record in records:
+            self.add(record)
+
+    def flush(self):
+        self._data.flush()
+        if self._pending:
+            np.array(self._pending, dtype="<u8").tofile(self._index)
+            self._index.flush()
+            self._pending = []
+
+    def close(self):
+        if not self._data.closed:
+            self.flush()
+            self._data.close()
+            self._index.close()
+        self.store._offsets = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
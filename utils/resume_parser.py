@@ -1,42 +1,151 @@
+import io
 import os
 import json
-import re
-import docx
+import multiprocessing
+import multiprocessing.connection
+import time
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from pypdf import PdfReader
 from collections import defaultdict
-import spacy
 
-# ✅ Load the model directly (it will be installed via requirements.txt)
-nlp = spacy.load("en_core_web_sm")
+from utils.buffer_store import InMemoryFile
+from utils.lazy import LazyModel, warm_up
+from utils.skills_extractor import extract_skills
+
+# ✅ spaCy model (installed via requirements.txt), loaded on first use
+def _load_nlp():
+    import spacy
+    return spacy.load("en_core_web_sm")
+
+nlp = LazyModel("en_core_web_sm", _load_nlp)
+
+# 🔥 Start loading spaCy in the background
+def warm_up_nlp():
+    return warm_up(nlp)
+
+# ✂️ Components parse_resume never reads; only doc.ents is used
+UNUSED_COMPONENTS = ["tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
+# 🧹 Pipes to disable for NER-only runs (tok2vec is kept if ner listens to it)
+def ner_disabled_components(pipeline) -> list:
+    disabled = [name for name in UNUSED_COMPONENTS if name in pipeline.pipe_names]
+    if "tok2vec" in pipeline.pipe_names:
+        listeners = getattr(pipeline.get_pipe("tok2vec"), "listening_components", [])
+        if not any(name not in disabled for name in listeners):
+            disabled.append("tok2vec")
+    return disabled
+
+@lru_cache(maxsize=1)
+def ner_disabled() -> tuple:
+    return tuple(ner_disabled_components(nlp.get()))
 
 # 📁 Path setup
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 RESUME_FOLDER = PROJECT_ROOT / "data" / "resumes"
 OUTPUT_FILE = PROJECT_ROOT / "data" / "recruiter_output.json"
 
+# ⚙️ Extraction pool settings
+SUPPORTED_SUFFIXES = {".pdf", ".docx"}
+MAX_WORKERS = max(1, (os.cpu_count() or 1) - 1)
+FILE_TIMEOUT = 60  # seconds a single file may take before it is abandoned
+# Pools are started from JobQueue worker threads; forking a threaded process can copy held locks
+# into the children and deadlock them, so workers start from a clean process instead
+POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# ⚙️ Extraction budget: stop reading once enough text is collected; skip files that cannot be resumes
+MAX_PDF_PAGES = 10  # pages read from a PDF (portfolios attached after the resume are ignored)
+MAX_TEXT_CHARS = 40_000  # characters kept per resume, far more than any real resume
+MAX_FILE_BYTES = 20 * 1024 * 1024  # larger uploads are skipped without being opened
+IMAGE_ONLY_PAGES = 2  # a PDF with no text on its first pages is treated as scanned
+
+# 🚫 File skipped on purpose (too big, scanned, empty); the message says why
+class UnsupportedResume(ValueError):
+    pass
+
+# ⚙️ spaCy batching settings
+NLP_BATCH_SIZE = 32
+NLP_PROCESSES = 1
+
+# ✂️ Join text pieces lazily, stopping as soon as max_chars have been collected
+def collect_text(pieces, max_chars=MAX_TEXT_CHARS) -> str:
+    collected, size = [], 0
+    for piece in pieces:
+        collected.append(piece)
+        size += len(piece) + 1
+        if size >= max_chars:
+            break
+    return "\n".join(collected)[:max_chars]
+
+# 📥 What the extractors open: a path, an InMemoryFile, raw bytes/memoryview or a binary stream.
+#    In-memory sources are wrapped, not copied, so uploads never go through the disk.
+def open_source(source):
+    if isinstance(source, InMemoryFile):
+        return io.BytesIO(source.data)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if hasattr(source, "read"):
+        return source
+    return str(source)
+
+# 📏 Size in bytes, or None for streams
+def source_size(source):
+    if isinstance(source, InMemoryFile):
+        return source.size
+    if isinstance(source, (bytes, bytearray)):
+        return len(source)
+    if isinstance(source, memoryview):
+        return source.nbytes
+    if hasattr(source, "read"):
+        return None
+    return Path(source).stat().st_size
+
+# 📑 Page texts of a PDF, one page at a time; pages past max_pages are never decoded
+#    Gives up early when the first pages carry no text layer (scanned PDFs)
+def iter_pdf_pages(source, max_pages=MAX_PDF_PAGES):
+    from pypdf import PdfReader
+    reader = PdfReader(open_source(source))
+    found_text = False
+    for number, page in enumerate(islice(reader.pages, max_pages), start=1):
+        text = page.extract_text() or ""
+        found_text = found_text or bool(text.strip())
+        if number >= IMAGE_ONLY_PAGES and not found_text:
+            raise UnsupportedResume(f"no text on the first {number} pages (scanned or image-only PDF?)")
+        yield text
+
 # 📄 Extract from PDF
-def extract_from_pdf(file_path: Path) -> str:
-    reader = PdfReader(str(file_path))
-    return "\n".join([page.extract_text() or "" for page in reader.pages])
+def extract_from_pdf(source, max_pages=MAX_PDF_PAGES, max_chars=MAX_TEXT_CHARS) -> str:
+    return collect_text(iter_pdf_pages(source, max_pages), max_chars)
 
 # 📄 Extract from DOCX
-def extract_from_docx(file_path: Path) -> str:
-    doc = docx.Document(str(file_path))
-    return "\n".join([para.text for para in doc.paragraphs])
-
-# 📄 Universal extractor
-def extract_text(file_path: Path) -> str:
-    if file_path.suffix.lower() == ".pdf":
-        return extract_from_pdf(file_path)
-    elif file_path.suffix.lower() == ".docx":
-        return extract_from_docx(file_path)
+def extract_from_docx(source, max_chars=MAX_TEXT_CHARS) -> str:
+    import docx
+    doc = docx.Document(open_source(source))
+    return collect_text((para.text for para in doc.paragraphs), max_chars)
+
+# 📄 Universal extractor; file_name gives the type for raw buffers and streams
+def extract_text(source, max_pages=MAX_PDF_PAGES, max_chars=MAX_TEXT_CHARS, file_name=None) -> str:
+    size = source_size(source)
+    if size is not None and size > MAX_FILE_BYTES:
+        raise UnsupportedResume(f"file too large ({size / 1024 / 1024:.0f} MB > {MAX_FILE_BYTES / 1024 / 1024:.0f} MB)")
+
+    file_name = file_name or getattr(source, "name", None) or ""
+    suffix = Path(str(file_name)).suffix.lower()
+    if suffix == ".pdf":
+        text = extract_from_pdf(source, max_pages, max_chars)
+    elif suffix == ".docx":
+        text = extract_from_docx(source, max_chars)
     else:
-        raise ValueError(f"Unsupported file type: {file_path.name}")
+        raise ValueError(f"Unsupported file type: {Path(str(file_name)).name or type(source).__name__}")
 
-# 🔍 Parse resume text with spaCy + regex
-def parse_resume(text: str) -> dict:
-    doc = nlp(text)
+    if not text.strip():
+        raise UnsupportedResume("no extractable text (scanned or image-only document?)")
+    return text
+
+# 🏷️ Bucket PERSON/ORG/GPE/DATE entities and taxonomy skills from a parsed doc
+def build_parsed(text: str, doc) -> dict:
     out = defaultdict(list)
 
     for ent in doc.ents:
@@ -47,28 +156,173 @@ def parse_resume(text: str) -> dict:
         elif ent.label_ == "DATE":
             out["dates"].append(ent.text)
 
-    skills = re.findall(r"\b(python|sql|excel|pandas|tensorflow|aws|powerbi|communication|django)\b", text, re.I)
-    out["skills"] = list(set(map(str.lower, skills)))
+    out["skills"] = extract_skills(text)
     out["raw"] = text[:2000]
+    out["full_text"] = text
     return dict(out)
 
+# 🔍 Parse resume text with spaCy + regex
+def parse_resume(text: str) -> dict:
+    doc = nlp.get()(text, disable=ner_disabled())
+    return build_parsed(text, doc)
+
+# 📚 Parse many texts with one streamed nlp.pipe; as_tuples passes (text, context) through
+def parse_resumes(texts, batch_size=NLP_BATCH_SIZE, n_process=NLP_PROCESSES, as_tuples=False):
+    docs = nlp.get().pipe(texts, as_tuples=as_tuples, batch_size=batch_size, n_process=n_process,
+                          disable=ner_disabled())
+    for item in docs:
+        if as_tuples:
+            doc, context = item
+            yield build_parsed(doc.text, doc), context
+        else:
+            yield build_parsed(item.text, item)
+
+# 🧩 Extract one file's text; runs inside a pool worker and never raises. Returns (text, error, seconds)
+def extract_file(file_path: Path):
+    start = time.perf_counter()
+    try:
+        return extract_text(file_path), None, time.perf_counter() - start
+    except Exception as e:
+        return None, str(e), time.perf_counter() - start
+
+# 👷 Worker process: reports ready, then extracts one file per message until it gets None
+def extraction_worker(conn, extract=extract_file):
+    conn.send(None)
+    while True:
+        try:
+            file = conn.recv()
+        except EOFError:
+            return
+        if file is None:
+            return
+        conn.send(extract(file))
+
+# 👷 One worker process with its own pipe; task is the input index it is working on
+class ExtractionWorker:
+    def __init__(self, extract=extract_file):
+        self.conn, child_conn = POOL_CONTEXT.Pipe()
+        self.process = POOL_CONTEXT.Process(target=extraction_worker, args=(child_conn, extract), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.task = None
+        self.started = None
+
+    def submit(self, task, file):
+        self.conn.send(file)
+        self.task, self.started = task, time.monotonic()
+
+    def stop(self, kill=False):
+        if not kill:
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+            self.process.join(1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+# 🏭 Extract files in worker processes, yielding (file, text, error) in input order
+#    Each file's clock starts when a worker picks it up. A file over the timeout only costs its own
+#    worker, which is killed and replaced; the other workers keep going and finished results are kept.
+#    At most max_in_flight files are handed out past the oldest one not yet yielded.
+#    on_document(file, seconds, error) reports the time each file took inside its worker
+def extract_files_parallel(files, workers=MAX_WORKERS, timeout=FILE_TIMEOUT, max_in_flight=None, on_document=None,
+                           extract=extract_file):
+    def finished(file, text, error, seconds):
+        if on_document:
+            on_document(file, seconds, error)
+        return file, text, error
+
+    files = list(files)
+    if workers <= 1:
+        for file in files:
+            yield finished(file, *extract(file))
+        return
+
+    max_in_flight = max(max_in_flight or workers * 2, workers)
+    pool = [ExtractionWorker(extract) for _ in range(min(workers, len(files)))]
+    results = {}  # input index -> (text, error, seconds), until its turn to be yielded
+    next_submit = next_yield = 0
+
+    def restart(slot):
+        pool[slot].stop(kill=True)
+        pool[slot] = ExtractionWorker(extract)
+
+    try:
+        while next_yield < len(files):
+            for worker in pool:
+                if worker.ready and worker.task is None and next_submit < len(files) \
+                        and next_submit - next_yield < max_in_flight:
+                    worker.submit(next_submit, files[next_submit])
+                    next_submit += 1
+
+            if next_yield in results:
+                while next_yield in results:
+                    yield finished(files[next_yield], *results.pop(next_yield))
+                    next_yield += 1
+                continue
+
+            deadlines = [worker.started + timeout for worker in pool if worker.task is not None]
+            wait_seconds = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            multiprocessing.connection.wait([worker.conn for worker in pool], timeout=wait_seconds)
+
+            for slot, worker in enumerate(pool):
+                elapsed = time.monotonic() - worker.started if worker.task is not None else 0.0
+                if worker.conn.poll():
+                    try:
+                        message = worker.conn.recv()
+                    except (EOFError, OSError):
+                        # The worker died (e.g. a crash inside a PDF library)
+                        if worker.task is not None:
+                            results[worker.task] = (None, "extraction worker exited unexpectedly", elapsed)
+                        restart(slot)
+                        continue
+                    if worker.ready:
+                        results[worker.task] = message
+                        worker.task = None
+                    worker.ready = True
+                elif worker.task is not None and elapsed >= timeout:
+                    results[worker.task] = (None, f"timed out after {timeout}s", elapsed)
+                    restart(slot)
+    finally:
+        for worker in pool:
+            worker.stop(kill=worker.task is not None)
+
+# 🧪 Extract in the pool, then batch NER; yields (file, parsed, error) in input order
+def parse_files_parallel(files, workers=MAX_WORKERS, timeout=FILE_TIMEOUT, max_in_flight=None,
+                         batch_size=NLP_BATCH_SIZE, n_process=NLP_PROCESSES, on_document=None):
+    extracted = extract_files_parallel(files, workers=workers, timeout=timeout, max_in_flight=max_in_flight,
+                                       on_document=on_document)
+    pairs = ((text or "", (file, error)) for file, text, error in extracted)
+    for parsed, (file, error) in parse_resumes(pairs, batch_size=batch_size, n_process=n_process, as_tuples=True):
+        if error:
+            yield file, None, error
+        else:
+            parsed["file_name"] = file.name
+            yield file, parsed, None
+
+# 📂 Supported resume files in a folder, in a stable order
+def list_resume_files(folder: Path = RESUME_FOLDER) -> list:
+    return sorted(f for f in Path(folder).iterdir() if f.suffix.lower() in SUPPORTED_SUFFIXES)
+
 # 🚀 Batch parse all resumes
-def batch_parse_resumes():
+def batch_parse_resumes(workers=MAX_WORKERS, timeout=FILE_TIMEOUT, batch_size=NLP_BATCH_SIZE, n_process=NLP_PROCESSES):
     all_parsed = []
 
     if not RESUME_FOLDER.exists():
         print(f"❌ Folder not found: {RESUME_FOLDER}")
         return
 
-    for file in RESUME_FOLDER.iterdir():
-        if file.suffix.lower() in [".pdf", ".docx"]:
-            try:
-                text = extract_text(file)
-                parsed = parse_resume(text)
-                parsed["file_name"] = file.name
-                all_parsed.append(parsed)
-            except Exception as e:
-                print(f"⚠️ Error processing {file.name}: {e}")
+    files = list_resume_files(RESUME_FOLDER)
+    for file, parsed, error in parse_files_parallel(files, workers=workers, timeout=timeout,
+                                                     batch_size=batch_size, n_process=n_process):
+        if error:
+            print(f"⚠️ Error processing {file.name}: {error}")
+        else:
+            all_parsed.append(parsed)
 
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
         json.dump(all_parsed, f, indent=2)
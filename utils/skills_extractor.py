@@ -0,0 +1,83 @@
+import json
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+from utils.lazy import LazyModel
+from utils.phrase_matcher import PhraseMatcher
+
+# 📁 Path setup
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+TAXONOMY_FILE = PROJECT_ROOT / "data" / "skills_taxonomy.json"
+CACHE_FILE = PROJECT_ROOT / "data" / "skills_matcher.pkl"
+CACHE_VERSION = 2  # bumped whenever PhraseMatcher's pickled layout changes
+
+# 🧠 Used when no taxonomy file is present (the original hard-coded list)
+DEFAULT_SKILLS = ["python", "sql", "excel", "pandas", "tensorflow", "aws", "powerbi", "communication", "django"]
+
+# 📚 Taxonomy: {canonical skill: [aliases]}; a plain list means no aliases
+def load_skills_taxonomy(path=TAXONOMY_FILE) -> dict:
+    if not Path(path).exists():
+        return {skill: [] for skill in DEFAULT_SKILLS}
+    with open(path, "r", encoding="utf-8") as f:
+        taxonomy = json.load(f)
+    if isinstance(taxonomy, list):
+        taxonomy = {skill: [] for skill in taxonomy}
+    return {skill.lower(): [alias.lower() for alias in aliases] for skill, aliases in taxonomy.items()}
+
+# 🕸️ Every skill and alias maps to its canonical name
+def build_skills_matcher(taxonomy: dict) -> PhraseMatcher:
+    matcher = PhraseMatcher()
+    for skill, aliases in taxonomy.items():
+        matcher.add(skill, skill)
+        for alias in aliases:
+            matcher.add(alias, skill)
+    matcher.fingerprint = hashlib.sha256(json.dumps(taxonomy, sort_keys=True).encode("utf-8")).hexdigest()
+    return matcher.build()
+
+# 💾 Compiled matcher cached on disk, rebuilt when the taxonomy file changes
+def load_skills_matcher(path=TAXONOMY_FILE, cache_file=CACHE_FILE) -> PhraseMatcher:
+    path = Path(path)
+    source = path.read_bytes() if path.exists() else json.dumps(DEFAULT_SKILLS).encode("utf-8")
+    fingerprint = hashlib.sha256(source).hexdigest()
+
+    cache_file = Path(cache_file)
+    if cache_file.exists():
+        try:
+            with open(cache_file, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("fingerprint") == fingerprint and cached.get("version") == CACHE_VERSION:
+                return cached["matcher"]
+        except Exception as e:
+            print(f"⚠️ Skills matcher cache unreadable, rebuilding: {e}")
+
+    matcher = build_skills_matcher(load_skills_taxonomy(path))
+    matcher.fingerprint = fingerprint  # the taxonomy file's hash, as used for the cache
+    try:
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump({"fingerprint": fingerprint, "version": CACHE_VERSION, "matcher": matcher}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"⚠️ Could not cache skills matcher: {e}")
+    return matcher
+
+skills_matcher = LazyModel("skills matcher", load_skills_matcher)
+
+# 🔁 Swap in a different taxonomy (dict or JSON file path)
+def use_skills_taxonomy(taxonomy):
+    global skills_matcher
+    if isinstance(taxonomy, dict):
+        matcher = build_skills_matcher(taxonomy)
+    else:
+        matcher = load_skills_matcher(taxonomy, cache_file=Path(taxonomy).with_suffix(".pkl"))
+    skills_matcher = LazyModel("skills matcher", lambda: matcher)
+
+# 🪪 Identity of the loaded taxonomy; part of the screening manifest's records key
+def skills_fingerprint():
+    return skills_matcher.get().fingerprint
+
+# 🔍 Canonical skills mentioned in the text, sorted
+def extract_skills(text: str) -> list:
+    return sorted(skills_matcher.get().find_unique(text))
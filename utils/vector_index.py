@@ -0,0 +1,169 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+# 📁 Path setup
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+INDEX_DIR = PROJECT_ROOT / "data" / "candidate_index"
+
+# ⚙️ IVF settings
+MIN_TRAIN_SIZE = 1024   # below this the index is a flat (exact) scan
+N_PROBE = 8             # inverted lists visited per query
+KMEANS_ITERATIONS = 10
+RETRAIN_GROWTH = 4      # re-cluster once the index is this many times its trained size
+
+# 🧭 Inverted-file (IVF) index over unit-length float32 vectors, keyed by string ids
+class IVFIndex:
+    def __init__(self, dim: int, index_dir: Path = INDEX_DIR):
+        self.dim = dim
+        self.index_dir = Path(index_dir)
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self.slot_ids = []            # slot -> id (None when free)
+        self.slot_lists = []          # slot -> inverted list number
+        self.id_to_slot = {}
+        self.free_slots = []
+        self.centroids = None         # None while untrained (flat search)
+        self.lists = [set()]          # inverted lists of slots
+        self.trained_size = 0
+        self._load()
+
+    def __len__(self):
+        return len(self.id_to_slot)
+
+    def __contains__(self, item_id):
+        return item_id in self.id_to_slot
+
+    def ids(self):
+        return list(self.id_to_slot)
+
+    # 📥 Load a saved index, if any
+    def _load(self):
+        meta_file = self.index_dir / "meta.json"
+        if not meta_file.exists():
+            return
+        try:
+            with open(meta_file, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            vectors = np.load(self.index_dir / "vectors.npy")
+            centroids_file = self.index_dir / "centroids.npy"
+            centroids = np.load(centroids_file) if meta.get("trained") else None
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Candidate index unreadable, rebuilding: {e}")
+            return
+        if meta.get("dim") != self.dim or len(meta["ids"]) != len(vectors):
+            print("⚠️ Candidate index does not match the embedding model, rebuilding")
+            return
+        self.vectors = vectors.astype(np.float32, copy=False)
+        self.slot_ids = list(meta["ids"])
+        self.slot_lists = [0] * len(self.slot_ids)
+        self.id_to_slot = {item_id: slot for slot, item_id in enumerate(self.slot_ids)}
+        self.trained_size = meta.get("trained_size", 0)
+        self.centroids = centroids
+        self._rebuild_lists()
+
+    # 💾 Save compacted vectors, ids and centroids
+    def save(self):
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        slots = list(self.id_to_slot.values())
+        np.save(self.index_dir / "vectors.npy", self.vectors[slots] if slots else self.vectors[:0])
+        if self.centroids is not None:
+            np.save(self.index_dir / "centroids.npy", self.centroids)
+        meta = {
+            "dim": self.dim,
+            "ids": list(self.id_to_slot),
+            "trained": self.centroids is not None,
+            "trained_size": self.trained_size,
+        }
+        tmp_file = self.index_dir / "meta.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_file, self.index_dir / "meta.json")
+
+    # 🧮 Nearest centroid per vector
+    def _assign(self, vectors):
+        if self.centroids is None:
+            return np.zeros(len(vectors), dtype=np.int64)
+        return np.argmax(vectors @ self.centroids.T, axis=1)
+
+    def _rebuild_lists(self):
+        n_lists = 1 if self.centroids is None else len(self.centroids)
+        self.lists = [set() for _ in range(n_lists)]
+        slots = np.fromiter(self.id_to_slot.values(), dtype=np.int64, count=len(self.id_to_slot))
+        if len(slots):
+            for slot, list_no in zip(slots.tolist(), self._assign(self.vectors[slots]).tolist()):
+                self.lists[list_no].add(slot)
+                self.slot_lists[slot] = list_no
+
+    # 🎯 Spherical k-means over the current vectors
+    def train(self, seed: int = 0):
+        slots = np.fromiter(self.id_to_slot.values(), dtype=np.int64, count=len(self.id_to_slot))
+        data = self.vectors[slots]
+        n_lists = max(1, int(np.sqrt(len(data))))
+        rng = np.random.default_rng(seed)
+        centroids = data[rng.choice(len(data), n_lists, replace=False)].copy()
+        for _ in range(KMEANS_ITERATIONS):
+            assign = np.argmax(data @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, data)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            empty = norms[:, 0] == 0
+            centroids = np.where(empty[:, None], centroids, sums / np.where(norms == 0, 1, norms))
+        self.centroids = centroids.astype(np.float32)
+        self.trained_size = len(data)
+        self._rebuild_lists()
+
+    # ➕ Insert or replace vectors (an id repeated within one call keeps its last vector)
+    def add(self, ids, vectors):
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        last_row = {item_id: row for row, item_id in enumerate(ids)}
+        if len(last_row) < len(ids):
+            ids, vectors = list(last_row), vectors[list(last_row.values())]
+        self.remove([item_id for item_id in ids if item_id in self.id_to_slot])
+        needed = len(ids) - len(self.free_slots)
+        if needed > 0:
+            grow = max(needed, len(self.vectors))
+            self.vectors = np.vstack([self.vectors, np.zeros((grow, self.dim), dtype=np.float32)])
+            new_slots = range(len(self.slot_ids), len(self.slot_ids) + grow)
+            self.slot_ids.extend([None] * grow)
+            self.slot_lists.extend([0] * grow)
+            self.free_slots.extend(reversed(new_slots))
+        slots = [self.free_slots.pop() for _ in ids]
+        self.vectors[slots] = vectors
+        for item_id, slot, list_no in zip(ids, slots, self._assign(vectors).tolist()):
+            self.slot_ids[slot] = item_id
+            self.id_to_slot[item_id] = slot
+            self.slot_lists[slot] = list_no
+            self.lists[list_no].add(slot)
+
+        trained = self.centroids is not None
+        if (not trained and len(self) >= MIN_TRAIN_SIZE) or (trained and len(self) > RETRAIN_GROWTH * self.trained_size):
+            self.train()
+
+    # ➖ Delete vectors by id (unknown ids are ignored)
+    def remove(self, ids):
+        for item_id in ids:
+            slot = self.id_to_slot.pop(item_id, None)
+            if slot is None:
+                continue
+            self.lists[self.slot_lists[slot]].discard(slot)
+            self.slot_ids[slot] = None
+            self.free_slots.append(slot)
+
+    # 🔍 Top-K ids by cosine similarity, scanning only the n_probe closest lists
+    def search(self, query, k: int, n_probe: int = N_PROBE):
+        query = np.asarray(query, dtype=np.float32).reshape(self.dim)
+        if self.centroids is None:
+            probe = [0]
+        else:
+            probe = np.argsort(-(self.centroids @ query))[:n_probe].tolist()
+        candidates = [slot for list_no in probe for slot in self.lists[list_no]]
+        if not candidates:
+            return []
+        slots = np.array(candidates, dtype=np.int64)
+        scores = self.vectors[slots] @ query
+        k = min(k, len(slots))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((slots[top], -scores[top]))]
+        return [(self.slot_ids[slots[i]], float(scores[i])) for i in top]
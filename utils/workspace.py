@@ -0,0 +1,43 @@
+import shutil
+import time
+import uuid
+from pathlib import Path
+
+# 📁 Path setup
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+WORKSPACES_DIR = PROJECT_ROOT / "data" / "workspaces"
+
+# ⚙️ Workspaces untouched for this long are deleted when a new one is created
+MAX_AGE_SECONDS = 24 * 60 * 60
+
+# 🧹 Remove workspaces nobody has used recently
+def cleanup_stale_workspaces(root: Path = WORKSPACES_DIR, max_age: float = MAX_AGE_SECONDS):
+    if not Path(root).exists():
+        return
+    cutoff = time.time() - max_age
+    for folder in Path(root).iterdir():
+        try:
+            if folder.is_dir() and folder.stat().st_mtime < cutoff:
+                shutil.rmtree(folder, ignore_errors=True)
+        except OSError:
+            continue
+
+# 🗂️ Private folder per screening session, so manifests never collide with other users
+class Workspace:
+    def __init__(self, workspace_id: str = None, root: Path = WORKSPACES_DIR):
+        if workspace_id is None:
+            cleanup_stale_workspaces(root)
+            workspace_id = uuid.uuid4().hex
+        self.id = workspace_id
+        self.folder = Path(root) / workspace_id
+        self.manifest_file = self.folder / "screening_manifest.json"
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+    def cleanup(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cleanup()